@@ -0,0 +1,14 @@
+"""Helpers shared by standalone scripts under scripts/."""
+
+from pathlib import Path
+from typing import Optional
+
+
+def find_project_root(start_path: Path) -> Optional[Path]:
+    """Find the project root by looking for a justfile."""
+    current = start_path.resolve()
+    while current != current.parent:
+        if (current / "justfile").exists():
+            return current
+        current = current.parent
+    return None
@@ -10,6 +10,9 @@ Editor command prerequisites:
   2. ~/.hammerspoon/init.lua contains: require("hs.ipc")
   3. hs CLI installed (Hammerspoon > Preferences > Install CLI tool)
   4. Hammerspoon granted Accessibility in System Settings > Privacy & Security
+
+If the optional watchfiles package is installed, Editor log waits wake on file
+system events instead of polling every POLL_INTERVAL.
 """
 
 import argparse
@@ -27,10 +30,15 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 import worktree as worktree_mod
 
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
+
 # Save builtins before shadowing with domain-specific subclasses.
 builtins_ConnectionRefusedError = ConnectionRefusedError
 builtins_TimeoutError = TimeoutError
@@ -40,6 +48,13 @@ EDITOR_LOG = Path.home() / "Library" / "Logs" / "Unity" / "Editor.log"
 TIMEOUT_SECONDS = 120
 TEST_TIMEOUT_SECONDS = 300
 POLL_INTERVAL = 0.3
+HS_PING_TIMEOUT_SECONDS = 1.0
+HS_LAUNCH_TIMEOUT_SECONDS = 15.0
+HS_RESTART_TIMEOUT_SECONDS = 5.0
+HS_LAUNCH_POLL_INTERVAL = 0.1
+PLAY_MODE_PROBE_TIMEOUT_SECONDS = 0.1
+LOG_WATCH_TIMEOUT_SECONDS = 1.0
+LOG_WATCH_DEBOUNCE_MS = 50
 DEFAULT_ABU_PORT = 9999
 ABU_STATE_FILE = Path(__file__).resolve().parent.parent.parent / ".abu-state.json"
 WORKTREE_BASE = Path.home() / "dreamtides-worktrees"
@@ -50,6 +65,20 @@ RESTART_TIMEOUT_SECONDS = 180
 UNITY_EXECUTABLE_PATTERN = "/Unity.app/Contents/MacOS/Unity"
 CLIENT_DIR = Path(__file__).resolve().parent.parent.parent / "client"
 
+# Editor log markers that drive wait_for_refresh.
+COMPILATION_REQUESTED = b"[ScriptCompilation] Requested"
+INITIAL_REFRESH = b"RefreshV2(NoUpdateAssetOptions)"
+IMPORT_STOPPED = b"StopAssetImportingV2"
+BUILD_FAILED = b"Tundra build failed"
+REFRESH_MARKERS = (COMPILATION_REQUESTED, INITIAL_REFRESH, IMPORT_STOPPED, BUILD_FAILED)
+
+# Editor log markers that drive wait_for_tests.
+TEST_RUNNER_TAG = b"[TestRunner]"
+TEST_RUNNER_ERROR = b"An unexpected error happened while running tests"
+TEST_SUMMARY_PATTERN = re.compile(
+    rb"(\d+) passed, (\d+) failed, (\d+) skipped \(total: (\d+)\)"
+)
+
 # Mode name mapping: normalized input → (menu label, GameMode enum name for log)
 MODE_MAP: dict[str, tuple[str, str]] = {
     "quest": ("Quest", "Quest"),
@@ -96,6 +125,10 @@ class HammerspoonError(AbuError):
     """Raised when Hammerspoon CLI interaction fails."""
 
 
+class HammerspoonCliNotFoundError(HammerspoonError):
+    """Raised when the Hammerspoon 'hs' CLI is not installed."""
+
+
 class UnityNotFoundError(AbuError):
     """Raised when Unity Editor is not running."""
 
@@ -318,7 +351,7 @@ def send_command_with_wait(
     )
 
 
-def run_hs(lua_code: str) -> str:
+def run_hs(lua_code: str, timeout: float = 10) -> str:
     """Execute Lua code via the Hammerspoon CLI and return stdout.
 
     Filters out extension loading lines. Raises HammerspoonError on failure.
@@ -329,10 +362,10 @@ def run_hs(lua_code: str) -> str:
             stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=timeout,
         )
     except FileNotFoundError:
-        raise HammerspoonError(
+        raise HammerspoonCliNotFoundError(
             "'hs' CLI not found on PATH. "
             "Install via: Hammerspoon > Preferences > Install CLI tool"
         )
@@ -365,36 +398,57 @@ def _restart_hammerspoon() -> None:
     )
     time.sleep(2)
     subprocess.run(["open", "-a", "Hammerspoon"])
-    time.sleep(5)
+
+
+def _wait_for_hammerspoon(timeout: float) -> bool:
+    """Ping Hammerspoon until it responds or timeout seconds pass.
+
+    Returns True once a ping succeeds, so a fast launch is not held up by a
+    fixed worst-case sleep.
+    """
+    deadline = time.time() + timeout
+    while True:
+        try:
+            run_hs('return "ok"', timeout=HS_PING_TIMEOUT_SECONDS)
+            return True
+        except HammerspoonError:
+            if time.time() >= deadline:
+                return False
+        time.sleep(HS_LAUNCH_POLL_INTERVAL)
 
 
 def ensure_hammerspoon() -> None:
     """Verify Hammerspoon is running with a working IPC connection.
 
-    Launches Hammerspoon if it is not running. Performs a health check
-    to verify IPC is responsive. If the check fails, restarts
-    Hammerspoon and retries once before raising.
+    Pings Hammerspoon over IPC. If the ping fails and Hammerspoon is not
+    running, launches it and polls until it responds. If it is running but
+    not responding, or never responds after launching, restarts it and polls
+    once more before raising. A missing 'hs' CLI is raised immediately.
     """
+    try:
+        run_hs('return "ok"')
+        return
+    except HammerspoonCliNotFoundError:
+        raise
+    except HammerspoonError:
+        pass
+
     result = subprocess.run(["pgrep", "-x", "Hammerspoon"], capture_output=True)
     if result.returncode != 0:
         print("Hammerspoon is not running. Launching...")
         subprocess.run(["open", "-a", "Hammerspoon"])
-        time.sleep(5)
-        print("Hammerspoon launched.")
+        if _wait_for_hammerspoon(HS_LAUNCH_TIMEOUT_SECONDS):
+            print("Hammerspoon launched.")
+            return
 
-    try:
-        run_hs('return "ok"')
-    except HammerspoonError:
-        print("Hammerspoon IPC is not responding. Restarting...")
-        _restart_hammerspoon()
-        try:
-            run_hs('return "ok"')
-        except HammerspoonError:
-            raise HammerspoonError(
-                "Hammerspoon is not responding after restart. "
-                "Try manually relaunching from the menu bar."
-            )
-        print("Hammerspoon restarted successfully.")
+    print("Hammerspoon IPC is not responding. Restarting...")
+    _restart_hammerspoon()
+    if not _wait_for_hammerspoon(HS_RESTART_TIMEOUT_SECONDS):
+        raise HammerspoonError(
+            "Hammerspoon is not responding after restart. "
+            "Try manually relaunching from the menu bar."
+        )
+    print("Hammerspoon restarted successfully.")
 
 
 def is_worktree() -> bool:
@@ -647,44 +701,158 @@ def get_log_size(log_path: Path | None = None) -> int:
         return 0
 
 
-def read_new_log(offset: int, log_path: Path | None = None) -> str:
-    """Read new content from the Unity Editor log starting at offset."""
-    if log_path is None:
-        log_path = resolve_editor_log()
-    try:
-        with open(log_path, "r", errors="replace") as f:
-            f.seek(offset)
-            return f.read()
-    except OSError:
-        return ""
+def _decode_log(data: bytes) -> str:
+    """Decode Editor log bytes, replacing any invalid UTF-8 sequences."""
+    return data.decode("utf-8", errors="replace")
+
+
+class LogTail:
+    """Incrementally reads lines appended to a log file after an offset.
 
+    Keeps the file open between polls so each read returns only new content.
+    If the log is replaced or truncated (e.g. Unity restarting), it is read
+    again from its beginning.
+    """
 
-def _report_result(content: str) -> RefreshResult:
-    """Parse log content to build a RefreshResult."""
-    seen: set[str] = set()
-    errors: list[str] = []
-    for line in content.splitlines():
-        stripped = line.strip()
-        if "error CS" in stripped and stripped not in seen:
-            seen.add(stripped)
-            errors.append(stripped)
+    def __init__(self, offset: int, log_path: Path | None = None) -> None:
+        self.log_path = log_path if log_path is not None else resolve_editor_log()
+        self._offset = offset
+        self._file: BinaryIO | None = None
+        self._inode = 0
+        self._size = 0
+        self._partial = b""
+        self._watcher: Any = None
+
+    def wait(self) -> None:
+        """Block until the log may have changed.
+
+        Uses watchfiles to wake on file system events when it is available,
+        returning after at most LOG_WATCH_TIMEOUT_SECONDS so callers can check
+        their deadlines. Otherwise sleeps for POLL_INTERVAL.
+        """
+        if watchfiles is None or not self.log_path.parent.is_dir():
+            time.sleep(POLL_INTERVAL)
+            return
 
-    if errors:
+        if self._watcher is None:
+            log_name = self.log_path.name
+            self._watcher = watchfiles.watch(
+                self.log_path.parent,
+                watch_filter=lambda _change, path: Path(path).name == log_name,
+                debounce=LOG_WATCH_DEBOUNCE_MS,
+                step=LOG_WATCH_DEBOUNCE_MS,
+                rust_timeout=int(LOG_WATCH_TIMEOUT_SECONDS * 1000),
+                yield_on_timeout=True,
+                recursive=False,
+            )
+        next(self._watcher, None)
+
+    def read(self) -> bytes:
+        """Return bytes appended since the previous read.
+
+        Each poll makes a single stat of the log path; its inode and size are
+        compared with the cached values, and the file is only reopened or read
+        when one of them changed. Decoding is left to callers so that only
+        reported lines pay for it.
+        """
+        try:
+            path_stat = os.stat(self.log_path)
+        except OSError:
+            return b""
+
+        if self._file is not None and path_stat.st_ino != self._inode:
+            self._file.close()
+            self._file = None
+            self._offset = 0
+            self._partial = b""
+
+        size = path_stat.st_size
+        if self._file is None:
+            try:
+                self._file = open(self.log_path, "rb")
+                file_stat = os.fstat(self._file.fileno())
+                self._file.seek(self._offset)
+            except OSError:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return b""
+            self._inode = file_stat.st_ino
+            self._size = self._offset
+            size = file_stat.st_size
+
+        if size == self._size:
+            return b""
+        try:
+            if size < self._size:
+                self._file.seek(0)
+                self._partial = b""
+            self._size = size
+            return self._file.read()
+        except OSError:
+            return b""
+
+    def read_lines(self) -> list[bytes]:
+        """Return complete lines appended since the previous call.
+
+        A trailing line without a newline is held back until it is finished.
+        """
+        lines = (self._partial + self.read()).split(b"\n")
+        self._partial = lines.pop()
+        return lines
+
+    def close(self) -> None:
+        """Close the underlying file and stop watching it, if active."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._watcher is not None:
+            self._watcher.close()
+            self._watcher = None
+
+
+class RefreshScan:
+    """Accumulates refresh progress and outcome from Editor log lines.
+
+    Lines are fed in as they arrive so that each poll only examines new output.
+    """
+
+    def __init__(self) -> None:
+        self.markers: set[bytes] = set()
+        self.errors: list[str] = []
+        self.summary = b""
+        self._seen_errors: set[bytes] = set()
+
+    def add_lines(self, lines: list[bytes]) -> None:
+        """Record markers, compilation errors and the latest refresh summary."""
+        for line in lines:
+            if b"error CS" in line:
+                stripped = line.strip()
+                if stripped not in self._seen_errors:
+                    self._seen_errors.add(stripped)
+                    self.errors.append(_decode_log(stripped))
+            if b"Asset Pipeline Refresh" in line:
+                self.summary = line.strip()
+            for marker in REFRESH_MARKERS:
+                if marker in line:
+                    self.markers.add(marker)
+
+    def result(self) -> RefreshResult:
+        """Build the RefreshResult for the lines seen so far."""
+        if self.errors:
+            return RefreshResult(
+                finished=True,
+                success=False,
+                errors=list(self.errors),
+                summary=f"{len(self.errors)} compilation error(s)",
+            )
         return RefreshResult(
             finished=True,
-            success=False,
-            errors=errors,
-            summary=f"{len(errors)} compilation error(s)",
+            success=True,
+            errors=[],
+            summary=_decode_log(self.summary),
         )
 
-    summary = ""
-    for line in reversed(content.splitlines()):
-        if "Asset Pipeline Refresh" in line:
-            summary = line.strip()
-            break
-
-    return RefreshResult(finished=True, success=True, errors=[], summary=summary)
-
 
 def wait_for_refresh(log_offset: int) -> RefreshResult:
     """Poll the Editor log for refresh completion.
@@ -694,32 +862,26 @@ def wait_for_refresh(log_offset: int) -> RefreshResult:
     the outcome.
     """
     start = time.time()
-    seen_initial_refresh = False
-    needs_compilation = False
-
-    while time.time() - start < TIMEOUT_SECONDS:
-        content = read_new_log(log_offset)
-
-        if "[ScriptCompilation] Requested" in content:
-            needs_compilation = True
-
-        if "RefreshV2(NoUpdateAssetOptions)" in content:
-            seen_initial_refresh = True
-
-        if needs_compilation:
-            if "StopAssetImportingV2" in content:
-                return _report_result(content)
-            if "Tundra build failed" in content:
-                return _report_result(content)
-        elif seen_initial_refresh:
-            time.sleep(1.0)
-            content = read_new_log(log_offset)
-            if "[ScriptCompilation] Requested" in content:
-                needs_compilation = True
-                continue
-            return _report_result(content)
+    tail = LogTail(log_offset)
+    scan = RefreshScan()
 
-        time.sleep(POLL_INTERVAL)
+    try:
+        while time.time() - start < TIMEOUT_SECONDS:
+            scan.add_lines(tail.read_lines())
+
+            if COMPILATION_REQUESTED in scan.markers:
+                if IMPORT_STOPPED in scan.markers or BUILD_FAILED in scan.markers:
+                    return scan.result()
+            elif INITIAL_REFRESH in scan.markers:
+                time.sleep(1.0)
+                scan.add_lines(tail.read_lines())
+                if COMPILATION_REQUESTED in scan.markers:
+                    continue
+                return scan.result()
+
+            tail.wait()
+    finally:
+        tail.close()
 
     return RefreshResult(
         finished=False,
@@ -729,6 +891,35 @@ def wait_for_refresh(log_offset: int) -> RefreshResult:
     )
 
 
+def _parse_test_summary(line: bytes) -> tuple[int, int, int, int] | None:
+    """Parse passed, failed, skipped and total counts from a Run finished line.
+
+    Splits on the fixed format written by RunAllTestsCommand.cs, falling back
+    to TEST_SUMMARY_PATTERN if the line does not match it exactly.
+    """
+    _, _, rest = line.partition(b"Run finished:")
+    parts = rest.replace(b"(", b" ").replace(b")", b" ").replace(b",", b" ").split()
+    if (
+        len(parts) == 8
+        and parts[1:6:2] == [b"passed", b"failed", b"skipped"]
+        and parts[6] == b"total:"
+    ):
+        try:
+            return int(parts[0]), int(parts[2]), int(parts[4]), int(parts[7])
+        except ValueError:
+            pass
+
+    match = TEST_SUMMARY_PATTERN.search(line)
+    if not match:
+        return None
+    return (
+        int(match.group(1)),
+        int(match.group(2)),
+        int(match.group(3)),
+        int(match.group(4)),
+    )
+
+
 def wait_for_tests(log_offset: int) -> TestResult:
     """Poll the Editor log for test run completion.
 
@@ -736,49 +927,52 @@ def wait_for_tests(log_offset: int) -> TestResult:
     Returns a TestResult describing the outcome.
     """
     start = time.time()
+    tail = LogTail(log_offset)
+    failures: list[str] = []
 
-    while time.time() - start < TEST_TIMEOUT_SECONDS:
-        content = read_new_log(log_offset)
-
-        for line in content.splitlines():
-            if "An unexpected error happened while running tests" in line:
-                return TestResult(
-                    finished=True,
-                    success=False,
-                    failures=["An unexpected error happened while running tests"],
-                    summary="Test runner encountered an unexpected error",
-                )
+    try:
+        while time.time() - start < TEST_TIMEOUT_SECONDS:
+            new_lines = tail.read_lines()
+            chunk = b"\n".join(new_lines)
+            if TEST_RUNNER_TAG not in chunk and TEST_RUNNER_ERROR not in chunk:
+                tail.wait()
+                continue
 
-            if "[TestRunner] Run finished:" in line:
-                failures = []
-                for log_line in content.splitlines():
-                    if "[TestRunner] FAIL:" in log_line:
-                        idx = log_line.find("[TestRunner] FAIL:")
-                        if idx >= 0:
-                            failures.append(log_line[idx:].strip())
-
-                match = re.search(
-                    r"(\d+) passed, (\d+) failed, (\d+) skipped " r"\(total: (\d+)\)",
-                    line,
-                )
-                if match:
-                    passed = int(match.group(1))
-                    failed = int(match.group(2))
-                    skipped = int(match.group(3))
-                    total = int(match.group(4))
+            for line in new_lines:
+                if TEST_RUNNER_ERROR in line:
                     return TestResult(
                         finished=True,
-                        success=failed == 0,
-                        passed=passed,
-                        failed=failed,
-                        skipped=skipped,
-                        total=total,
-                        failures=failures,
-                        summary=f"{passed} passed, {failed} failed, "
-                        f"{skipped} skipped (total: {total})",
+                        success=False,
+                        failures=[_decode_log(TEST_RUNNER_ERROR)],
+                        summary="Test runner encountered an unexpected error",
                     )
 
-        time.sleep(POLL_INTERVAL)
+                if TEST_RUNNER_TAG not in line:
+                    continue
+
+                idx = line.find(b"[TestRunner] FAIL:")
+                if idx >= 0:
+                    failures.append(_decode_log(line[idx:].strip()))
+
+                if b"[TestRunner] Run finished:" in line:
+                    counts = _parse_test_summary(line)
+                    if counts:
+                        passed, failed, skipped, total = counts
+                        return TestResult(
+                            finished=True,
+                            success=failed == 0,
+                            passed=passed,
+                            failed=failed,
+                            skipped=skipped,
+                            total=total,
+                            failures=failures,
+                            summary=f"{passed} passed, {failed} failed, "
+                            f"{skipped} skipped (total: {total})",
+                        )
+
+            tail.wait()
+    finally:
+        tail.close()
 
     return TestResult(
         finished=False,
@@ -788,17 +982,19 @@ def wait_for_tests(log_offset: int) -> TestResult:
 
 
 def is_play_mode_active(port: int | None = None) -> bool:
-    """Check if Unity is in play mode by probing the Abu TCP port."""
+    """Check if Unity is in play mode by probing the Abu TCP port.
+
+    Connects to 127.0.0.1 directly, matching the loopback address TcpServer.cs
+    listens on, to avoid resolving localhost.
+    """
     if port is None:
         port = resolve_port()
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
-        sock.settimeout(1.0)
-        sock.connect(("localhost", port))
-        sock.close()
-        return True
-    except (builtins_ConnectionRefusedError, OSError):
-        sock.close()
+        with socket.create_connection(
+            ("127.0.0.1", port), timeout=PLAY_MODE_PROBE_TIMEOUT_SECONDS
+        ):
+            return True
+    except OSError:
         return False
 
 
@@ -1346,24 +1542,32 @@ def do_restart() -> None:
     stable_since: float | None = None
     log_stable_seconds = 10.0
 
-    while time.monotonic() - start < RESTART_TIMEOUT_SECONDS:
-        if not saw_marker:
-            content = read_new_log(0, restart_log)
-            if "[AbuRestart] Ready" in content:
-                saw_marker = True
-                last_log_size = get_log_size(restart_log)
-                stable_since = time.monotonic()
-                print("  Domain reload complete, waiting for editor to settle...")
-        else:
-            current_size = get_log_size(restart_log)
-            if current_size != last_log_size:
-                last_log_size = current_size
-                stable_since = time.monotonic()
-            elif stable_since and time.monotonic() - stable_since >= log_stable_seconds:
-                print("Unity Editor is ready.")
-                return
+    tail = LogTail(0, restart_log)
 
-        time.sleep(POLL_INTERVAL)
+    try:
+        while time.monotonic() - start < RESTART_TIMEOUT_SECONDS:
+            if not saw_marker:
+                if any(b"[AbuRestart] Ready" in line for line in tail.read_lines()):
+                    saw_marker = True
+                    tail.close()
+                    last_log_size = get_log_size(restart_log)
+                    stable_since = time.monotonic()
+                    print("  Domain reload complete, waiting for editor to settle...")
+            else:
+                current_size = get_log_size(restart_log)
+                if current_size != last_log_size:
+                    last_log_size = current_size
+                    stable_since = time.monotonic()
+                elif (
+                    stable_since
+                    and time.monotonic() - stable_since >= log_stable_seconds
+                ):
+                    print("Unity Editor is ready.")
+                    return
+
+            time.sleep(POLL_INTERVAL)
+    finally:
+        tail.close()
 
     print(
         f"Warning: Timed out after {RESTART_TIMEOUT_SECONDS}s waiting for "
@@ -1401,6 +1605,7 @@ def do_set_mode(mode_name: str) -> None:
 
     menu_label, log_enum = MODE_MAP[normalized]
     expected_log = f"Set play mode to {log_enum}"
+    expected_bytes = expected_log.encode()
 
     log_offset = get_log_size()
     result_msg = send_menu_item(["Tools", "Play Mode", menu_label])
@@ -1408,12 +1613,15 @@ def do_set_mode(mode_name: str) -> None:
 
     print(f"Waiting for mode change to {menu_label}...")
     start = time.time()
-    while time.time() - start < 30:
-        content = read_new_log(log_offset)
-        if expected_log in content:
-            print(f"Mode set to {menu_label}.")
-            return
-        time.sleep(POLL_INTERVAL)
+    tail = LogTail(log_offset)
+    try:
+        while time.time() - start < 30:
+            if any(expected_bytes in line for line in tail.read_lines()):
+                print(f"Mode set to {menu_label}.")
+                return
+            time.sleep(POLL_INTERVAL)
+    finally:
+        tail.close()
 
     print(
         f"Warning: Did not see '{expected_log}' in Editor.log within 30s",
@@ -1439,6 +1647,7 @@ def do_set_device(device_name: str) -> None:
 
     menu_label, slug = DEVICE_MAP[normalized]
     expected_log = f"Set device to {slug}"
+    expected_bytes = expected_log.encode()
 
     log_offset = get_log_size()
     result_msg = send_menu_item(["Tools", "Device", menu_label])
@@ -1446,12 +1655,15 @@ def do_set_device(device_name: str) -> None:
 
     print(f"Waiting for device change to {menu_label}...")
     start = time.time()
-    while time.time() - start < 30:
-        content = read_new_log(log_offset)
-        if expected_log in content:
-            print(f"Device set to {menu_label}.")
-            return
-        time.sleep(POLL_INTERVAL)
+    tail = LogTail(log_offset)
+    try:
+        while time.time() - start < 30:
+            if any(expected_bytes in line for line in tail.read_lines()):
+                print(f"Device set to {menu_label}.")
+                return
+            time.sleep(POLL_INTERVAL)
+    finally:
+        tail.close()
 
     print(
         f"Warning: Did not see '{expected_log}' in Editor.log within 30s",
@@ -7,10 +7,12 @@ import json
 import os
 import socket
 import subprocess
+import tempfile
 import threading
 import unittest
 import uuid
 from pathlib import Path
+from typing import Callable, Iterator
 from unittest.mock import MagicMock, patch
 
 from abu import (
@@ -20,22 +22,29 @@ from abu import (
     ConnectionError,
     DEFAULT_ABU_PORT,
     EmptyResponseError,
+    HS_RESTART_TIMEOUT_SECONDS,
+    HammerspoonCliNotFoundError,
     HammerspoonError,
+    LogTail,
+    POLL_INTERVAL,
     RefreshResult,
+    RefreshScan,
     RefreshTimeoutError,
     UnityNotFoundError,
     UnityProcessInfo,
-    _report_result,
+    _parse_test_summary,
     build_command,
     build_params,
     build_parser,
     check_log_conflict,
     do_open,
     do_status,
+    ensure_hammerspoon,
     find_unity_executable,
     find_unity_process,
     handle_response,
     is_pid_alive,
+    is_play_mode_active,
     is_worktree,
     read_state_file,
     resolve_port,
@@ -44,6 +53,7 @@ from abu import (
     send_menu_item,
     strip_ref,
     wait_for_refresh,
+    wait_for_tests,
 )
 
 
@@ -409,9 +419,14 @@ class TestHandleResponse(unittest.TestCase):
 class TestBuildParser(unittest.TestCase):
     """Test argparse configuration for TCP commands."""
 
+    parser: argparse.ArgumentParser
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parser = build_parser()
+
     def test_snapshot_defaults(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["snapshot"])
+        args = self.parser.parse_args(["snapshot"])
         self.assertEqual(args.command, "snapshot")
         self.assertFalse(args.compact)
         self.assertFalse(args.interactive)
@@ -419,8 +434,7 @@ class TestBuildParser(unittest.TestCase):
         self.assertFalse(args.effect_logs)
 
     def test_snapshot_all_flags(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(
+        args = self.parser.parse_args(
             ["snapshot", "--compact", "--interactive", "--max-depth", "5"]
         )
         self.assertTrue(args.compact)
@@ -428,54 +442,45 @@ class TestBuildParser(unittest.TestCase):
         self.assertEqual(args.max_depth, 5)
 
     def test_snapshot_effect_logs_flag(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["snapshot", "--effect-logs"])
+        args = self.parser.parse_args(["snapshot", "--effect-logs"])
         self.assertTrue(args.effect_logs)
 
     def test_click_effect_logs_flag(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["click", "e1", "--effect-logs"])
+        args = self.parser.parse_args(["click", "e1", "--effect-logs"])
         self.assertTrue(args.effect_logs)
 
     def test_hover_effect_logs_flag(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["hover", "e1", "--effect-logs"])
+        args = self.parser.parse_args(["hover", "e1", "--effect-logs"])
         self.assertTrue(args.effect_logs)
 
     def test_drag_effect_logs_flag(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["drag", "e1", "--effect-logs"])
+        args = self.parser.parse_args(["drag", "e1", "--effect-logs"])
         self.assertTrue(args.effect_logs)
 
     def test_click_ref(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["click", "@e1"])
+        args = self.parser.parse_args(["click", "@e1"])
         self.assertEqual(args.command, "click")
         self.assertEqual(args.ref, "@e1")
 
     def test_hover_ref(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["hover", "e2"])
+        args = self.parser.parse_args(["hover", "e2"])
         self.assertEqual(args.command, "hover")
         self.assertEqual(args.ref, "e2")
 
     def test_drag_with_target(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["drag", "@e1", "@e2"])
+        args = self.parser.parse_args(["drag", "@e1", "@e2"])
         self.assertEqual(args.command, "drag")
         self.assertEqual(args.source, "@e1")
         self.assertEqual(args.target, "@e2")
 
     def test_drag_without_target(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["drag", "e1"])
+        args = self.parser.parse_args(["drag", "e1"])
         self.assertEqual(args.command, "drag")
         self.assertEqual(args.source, "e1")
         self.assertIsNone(args.target)
 
     def test_screenshot(self) -> None:
-        parser = build_parser()
-        args = parser.parse_args(["screenshot"])
+        args = self.parser.parse_args(["screenshot"])
         self.assertEqual(args.command, "screenshot")
 
 
@@ -622,12 +627,132 @@ class TestIsWorktree(unittest.TestCase):
         self.assertFalse(is_worktree())
 
 
-class TestReportResult(unittest.TestCase):
+class TestLogTail(unittest.TestCase):
+    """Test incremental reading of the Editor log."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_path = Path(self.tmpdir.name) / "Editor.log"
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_reads_from_offset(self) -> None:
+        self.log_path.write_text("old line\nnew line\n")
+        tail = LogTail(len("old line\n"), self.log_path)
+        self.assertEqual(tail.read_lines(), [b"new line"])
+        tail.close()
+
+    def test_returns_only_appended_lines(self) -> None:
+        self.log_path.write_text("first\n")
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"first"])
+        with open(self.log_path, "a") as f:
+            f.write("second\n")
+        self.assertEqual(tail.read_lines(), [b"second"])
+        self.assertEqual(tail.read_lines(), [])
+        tail.close()
+
+    def test_holds_back_partial_line(self) -> None:
+        self.log_path.write_text("complete\npart")
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"complete"])
+        with open(self.log_path, "a") as f:
+            f.write("ial\n")
+        self.assertEqual(tail.read_lines(), [b"partial"])
+        tail.close()
+
+    def test_missing_file_returns_nothing(self) -> None:
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [])
+        self.log_path.write_text("created\n")
+        self.assertEqual(tail.read_lines(), [b"created"])
+        tail.close()
+
+    def test_truncated_file_read_from_start(self) -> None:
+        self.log_path.write_text("a long line before truncation\n")
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"a long line before truncation"])
+        with open(self.log_path, "w") as f:
+            f.write("restarted\n")
+        self.assertEqual(tail.read_lines(), [b"restarted"])
+        tail.close()
+
+    def test_idle_poll_makes_one_stat_call(self) -> None:
+        self.log_path.write_text("first\n")
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"first"])
+        with (
+            patch("abu.os.stat", wraps=os.stat) as mock_stat,
+            patch("abu.os.fstat", wraps=os.fstat) as mock_fstat,
+        ):
+            self.assertEqual(tail.read_lines(), [])
+        mock_stat.assert_called_once_with(self.log_path)
+        mock_fstat.assert_not_called()
+        tail.close()
+
+    def test_wait_uses_watchfiles_when_available(self) -> None:
+        self.log_path.write_text("")
+        events: list[str] = []
+
+        def watch(path: Path, **kwargs: object) -> Iterator[set[object]]:
+            events.append(f"watch {Path(path).name}")
+            try:
+                while True:
+                    events.append("wake")
+                    yield set()
+            finally:
+                events.append("closed")
+
+        fake_watchfiles = MagicMock()
+        fake_watchfiles.watch.side_effect = watch
+        with (
+            patch("abu.watchfiles", fake_watchfiles),
+            patch("abu.time.sleep") as mock_sleep,
+        ):
+            tail = LogTail(0, self.log_path)
+            tail.wait()
+            tail.wait()
+            tail.close()
+        mock_sleep.assert_not_called()
+        fake_watchfiles.watch.assert_called_once()
+        watch_filter = fake_watchfiles.watch.call_args.kwargs["watch_filter"]
+        self.assertTrue(watch_filter(None, str(self.log_path)))
+        self.assertFalse(watch_filter(None, str(self.log_path.with_name("x.log"))))
+        self.assertEqual(
+            events, [f"watch {Path(self.tmpdir.name).name}", "wake", "wake", "closed"]
+        )
+
+    @patch("abu.watchfiles", None)
+    @patch("abu.time.sleep")
+    def test_wait_sleeps_without_watchfiles(self, mock_sleep: MagicMock) -> None:
+        tail = LogTail(0, self.log_path)
+        tail.wait()
+        mock_sleep.assert_called_once_with(POLL_INTERVAL)
+        tail.close()
+
+    def test_replaced_file_read_from_start(self) -> None:
+        self.log_path.write_text("before rotation\n")
+        tail = LogTail(0, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"before rotation"])
+        replacement = Path(self.tmpdir.name) / "Editor-new.log"
+        replacement.write_text("after rotation\n")
+        os.replace(replacement, self.log_path)
+        self.assertEqual(tail.read_lines(), [b"after rotation"])
+        tail.close()
+
+
+class TestRefreshScan(unittest.TestCase):
     """Test log parsing and RefreshResult construction."""
 
+    def _scan(self, content: bytes) -> RefreshResult:
+        scan = RefreshScan()
+        scan.add_lines(content.splitlines())
+        return scan.result()
+
     def test_no_errors(self) -> None:
-        content = "Some log line\n" "Asset Pipeline Refresh (id=abc): Total: 1.234s\n"
-        result = _report_result(content)
+        content = b"Some log line\n" b"Asset Pipeline Refresh (id=abc): Total: 1.234s\n"
+        result = self._scan(content)
         self.assertTrue(result.finished)
         self.assertTrue(result.success)
         self.assertEqual(result.errors, [])
@@ -635,24 +760,39 @@ class TestReportResult(unittest.TestCase):
 
     def test_compilation_errors(self) -> None:
         content = (
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
-            "Assets/Bar.cs(20,3): error CS0246: type not found\n"
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+            b"Assets/Bar.cs(20,3): error CS0246: type not found\n"
         )
-        result = _report_result(content)
+        result = self._scan(content)
         self.assertTrue(result.finished)
         self.assertFalse(result.success)
         self.assertEqual(len(result.errors), 2)
 
     def test_duplicate_errors_deduplicated(self) -> None:
         content = (
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
         )
-        result = _report_result(content)
+        result = self._scan(content)
         self.assertEqual(len(result.errors), 1)
 
+    def test_deduplication_keeps_first_occurrence_order(self) -> None:
+        content = (
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+            b"Assets/Bar.cs(20,3): error CS0246: type not found\n"
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+        )
+        result = self._scan(content)
+        self.assertEqual(
+            result.errors,
+            [
+                "Assets/Foo.cs(10,5): error CS1002: ; expected",
+                "Assets/Bar.cs(20,3): error CS0246: type not found",
+            ],
+        )
+
     def test_empty_content(self) -> None:
-        result = _report_result("")
+        result = self._scan(b"")
         self.assertTrue(result.finished)
         self.assertTrue(result.success)
         self.assertEqual(result.errors, [])
@@ -660,78 +800,187 @@ class TestReportResult(unittest.TestCase):
 
     def test_error_summary_message(self) -> None:
         content = (
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
-            "Assets/Bar.cs(20,3): error CS0246: type not found\n"
-            "Assets/Baz.cs(30,1): error CS0103: name does not exist\n"
+            b"Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+            b"Assets/Bar.cs(20,3): error CS0246: type not found\n"
+            b"Assets/Baz.cs(30,1): error CS0103: name does not exist\n"
         )
-        result = _report_result(content)
+        result = self._scan(content)
         self.assertEqual(result.summary, "3 compilation error(s)")
 
+    def test_lines_fed_incrementally(self) -> None:
+        scan = RefreshScan()
+        scan.add_lines([b"Assets/Foo.cs(10,5): error CS1002: ; expected"])
+        scan.add_lines(
+            [
+                b"Assets/Foo.cs(10,5): error CS1002: ; expected",
+                b"Asset Pipeline Refresh (id=abc): Total: 1.234s",
+            ]
+        )
+        result = scan.result()
+        self.assertFalse(result.success)
+        self.assertEqual(
+            result.errors, ["Assets/Foo.cs(10,5): error CS1002: ; expected"]
+        )
+
 
 class TestWaitForRefresh(unittest.TestCase):
     """Test refresh polling logic."""
 
+    def setUp(self) -> None:
+        watchfiles_patch = patch("abu.watchfiles", None)
+        watchfiles_patch.start()
+        self.addCleanup(watchfiles_patch.stop)
+
     @patch("abu.TIMEOUT_SECONDS", 0.5)
     @patch("abu.POLL_INTERVAL", 0.1)
-    @patch("abu.read_new_log")
+    @patch("abu.LogTail.read")
     def test_timeout_returns_not_finished(self, mock_read: MagicMock) -> None:
-        mock_read.return_value = ""
+        mock_read.return_value = b""
         result = wait_for_refresh(0)
         self.assertFalse(result.finished)
         self.assertFalse(result.success)
 
-    @patch("abu.POLL_INTERVAL", 0.01)
-    @patch("abu.read_new_log")
-    def test_no_compilation_refresh_completes(self, mock_read: MagicMock) -> None:
-        mock_read.return_value = (
-            "RefreshV2(NoUpdateAssetOptions)\n"
-            "Asset Pipeline Refresh (id=abc): Total: 0.5s\n"
+    def test_completion_scenarios(self) -> None:
+        # (name, log content, finished, success, error count or None)
+        scenarios: list[tuple[str, str, bool, bool, int | None]] = [
+            (
+                "no_compilation_refresh_completes",
+                "RefreshV2(NoUpdateAssetOptions)\n"
+                "Asset Pipeline Refresh (id=abc): Total: 0.5s\n",
+                True,
+                True,
+                None,
+            ),
+            (
+                "compilation_with_errors",
+                "[ScriptCompilation] Requested\n"
+                "RefreshV2(NoUpdateAssetOptions)\n"
+                "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
+                "StopAssetImportingV2\n",
+                True,
+                False,
+                1,
+            ),
+            (
+                "successful_compilation",
+                "[ScriptCompilation] Requested\n"
+                "RefreshV2(NoUpdateAssetOptions)\n"
+                "*** Tundra build success\n"
+                "Reloading assemblies after finishing script compilation.\n"
+                "StopAssetImportingV2\n"
+                "Asset Pipeline Refresh (id=abc): Total: 2.1s\n",
+                True,
+                True,
+                None,
+            ),
+            (
+                "tundra_build_failed",
+                "[ScriptCompilation] Requested\n"
+                "Tundra build failed\n"
+                "Assets/Foo.cs(10,5): error CS1002: ; expected\n",
+                True,
+                False,
+                None,
+            ),
+        ]
+
+        with (
+            patch("abu.POLL_INTERVAL", 0.01),
+            patch("abu.LogTail.read") as mock_read,
+        ):
+            for name, content, finished, success, error_count in scenarios:
+                with self.subTest(name=name):
+                    mock_read.side_effect = [content.encode()] + [b""] * 10
+                    result = wait_for_refresh(0)
+                    self.assertEqual(result.finished, finished)
+                    self.assertEqual(result.success, success)
+                    if error_count is not None:
+                        self.assertEqual(len(result.errors), error_count)
+
+
+class TestParseTestSummary(unittest.TestCase):
+    """Test parsing of the TestRunner summary line."""
+
+    def test_fixed_format(self) -> None:
+        line = b"[TestRunner] Run finished: 12 passed, 0 failed, 1 skipped (total: 13)"
+        self.assertEqual(_parse_test_summary(line), (12, 0, 1, 13))
+
+    def test_trailing_text_uses_regex_fallback(self) -> None:
+        line = (
+            b"[TestRunner] Run finished: 3 passed, 1 failed, 0 skipped (total: 4)"
+            b" in 2.5s"
         )
-        result = wait_for_refresh(0)
+        self.assertEqual(_parse_test_summary(line), (3, 1, 0, 4))
+
+    def test_unrecognized_line(self) -> None:
+        self.assertIsNone(_parse_test_summary(b"[TestRunner] Run finished: ???"))
+
+
+class TestWaitForTests(unittest.TestCase):
+    """Test test-run polling logic."""
+
+    def setUp(self) -> None:
+        watchfiles_patch = patch("abu.watchfiles", None)
+        watchfiles_patch.start()
+        self.addCleanup(watchfiles_patch.stop)
+
+    @patch("abu.POLL_INTERVAL", 0.01)
+    @patch("abu.LogTail.read")
+    def test_all_passed(self, mock_read: MagicMock) -> None:
+        mock_read.side_effect = [
+            b"[TestRunner] Run started\n",
+            b"[TestRunner] Run finished: 12 passed, 0 failed, 1 skipped (total: 13)\n",
+        ]
+        result = wait_for_tests(0)
         self.assertTrue(result.finished)
         self.assertTrue(result.success)
+        self.assertEqual(result.passed, 12)
+        self.assertEqual(result.skipped, 1)
+        self.assertEqual(result.total, 13)
+        self.assertEqual(result.failures, [])
 
     @patch("abu.POLL_INTERVAL", 0.01)
-    @patch("abu.read_new_log")
-    def test_compilation_with_errors(self, mock_read: MagicMock) -> None:
-        mock_read.return_value = (
-            "[ScriptCompilation] Requested\n"
-            "RefreshV2(NoUpdateAssetOptions)\n"
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
-            "StopAssetImportingV2\n"
-        )
-        result = wait_for_refresh(0)
+    @patch("abu.LogTail.read")
+    def test_failures_collected(self, mock_read: MagicMock) -> None:
+        mock_read.side_effect = [
+            b"Log: [TestRunner] FAIL: Tests.Foo\n"
+            b"[TestRunner] Run finished: 1 passed, 1 failed, 0 skipped (total: 2)\n",
+        ]
+        result = wait_for_tests(0)
         self.assertTrue(result.finished)
         self.assertFalse(result.success)
-        self.assertEqual(len(result.errors), 1)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(result.failures, ["[TestRunner] FAIL: Tests.Foo"])
 
     @patch("abu.POLL_INTERVAL", 0.01)
-    @patch("abu.read_new_log")
-    def test_successful_compilation(self, mock_read: MagicMock) -> None:
-        mock_read.return_value = (
-            "[ScriptCompilation] Requested\n"
-            "RefreshV2(NoUpdateAssetOptions)\n"
-            "*** Tundra build success\n"
-            "Reloading assemblies after finishing script compilation.\n"
-            "StopAssetImportingV2\n"
-            "Asset Pipeline Refresh (id=abc): Total: 2.1s\n"
-        )
-        result = wait_for_refresh(0)
-        self.assertTrue(result.finished)
-        self.assertTrue(result.success)
+    @patch("abu.LogTail.read")
+    def test_invalid_utf8_in_failure_is_replaced(self, mock_read: MagicMock) -> None:
+        mock_read.side_effect = [
+            b"[TestRunner] FAIL: Tests.Caf\xe9\n"
+            b"[TestRunner] Run finished: 0 passed, 1 failed, 0 skipped (total: 1)\n",
+        ]
+        result = wait_for_tests(0)
+        self.assertEqual(result.failures, ["[TestRunner] FAIL: Tests.Caf\ufffd"])
 
     @patch("abu.POLL_INTERVAL", 0.01)
-    @patch("abu.read_new_log")
-    def test_tundra_build_failed(self, mock_read: MagicMock) -> None:
-        mock_read.return_value = (
-            "[ScriptCompilation] Requested\n"
-            "Tundra build failed\n"
-            "Assets/Foo.cs(10,5): error CS1002: ; expected\n"
-        )
-        result = wait_for_refresh(0)
+    @patch("abu.LogTail.read")
+    def test_unexpected_error(self, mock_read: MagicMock) -> None:
+        mock_read.side_effect = [
+            b"An unexpected error happened while running tests\n",
+        ]
+        result = wait_for_tests(0)
         self.assertTrue(result.finished)
         self.assertFalse(result.success)
 
+    @patch("abu.TEST_TIMEOUT_SECONDS", 0.1)
+    @patch("abu.POLL_INTERVAL", 0.01)
+    @patch("abu.LogTail.read")
+    def test_timeout_returns_not_finished(self, mock_read: MagicMock) -> None:
+        mock_read.return_value = b""
+        result = wait_for_tests(0)
+        self.assertFalse(result.finished)
+        self.assertFalse(result.success)
+
 
 class TestBuildParserUnity(unittest.TestCase):
     """Test argparse configuration for editor commands."""
@@ -1108,6 +1357,127 @@ class TestResolvePort(unittest.TestCase):
             self.assertEqual(resolve_port(), 10000)
 
 
+class TestEnsureHammerspoon(unittest.TestCase):
+    """Test Hammerspoon liveness checks."""
+
+    def _fake_run(self, running: bool) -> Callable[..., MagicMock]:
+        def run(args: list[str], **_kwargs: object) -> MagicMock:
+            if args[0] == "pgrep":
+                return MagicMock(returncode=0 if running else 1)
+            return MagicMock(returncode=0)
+
+        return run
+
+    def _launches(self, mock_run: MagicMock) -> list[list[str]]:
+        return [c[0][0] for c in mock_run.call_args_list if c[0][0][0] == "open"]
+
+    @patch("abu.subprocess.run")
+    @patch("abu.run_hs", return_value="ok")
+    def test_responsive_skips_launch(
+        self, mock_hs: MagicMock, mock_run: MagicMock
+    ) -> None:
+        ensure_hammerspoon()
+        mock_hs.assert_called_once_with('return "ok"')
+        mock_run.assert_not_called()
+
+    @patch("abu.time.sleep")
+    @patch("abu.subprocess.run")
+    @patch("abu.run_hs", side_effect=[HammerspoonError("down"), "ok"])
+    def test_not_running_launches_and_retries(
+        self,
+        mock_hs: MagicMock,
+        mock_run: MagicMock,
+        _mock_sleep: MagicMock,
+    ) -> None:
+        mock_run.side_effect = self._fake_run(running=False)
+        ensure_hammerspoon()
+        self.assertEqual(mock_hs.call_count, 2)
+        self.assertEqual(self._launches(mock_run), [["open", "-a", "Hammerspoon"]])
+
+    @patch("abu.time.sleep")
+    @patch("abu.subprocess.run")
+    @patch(
+        "abu.run_hs",
+        side_effect=[HammerspoonError("down"), HammerspoonError("starting"), "ok"],
+    )
+    def test_polls_until_launch_responds(
+        self,
+        mock_hs: MagicMock,
+        mock_run: MagicMock,
+        mock_sleep: MagicMock,
+    ) -> None:
+        mock_run.side_effect = self._fake_run(running=False)
+        ensure_hammerspoon()
+        self.assertEqual(mock_hs.call_count, 3)
+        mock_sleep.assert_called_once_with(0.1)
+
+    @patch("abu.HS_RESTART_TIMEOUT_SECONDS", 0)
+    @patch("abu.HS_LAUNCH_TIMEOUT_SECONDS", 0)
+    @patch("abu._restart_hammerspoon")
+    @patch("abu.time.sleep")
+    @patch("abu.subprocess.run")
+    @patch("abu.run_hs", side_effect=HammerspoonError("down"))
+    def test_raises_after_failed_restart(
+        self,
+        _mock_hs: MagicMock,
+        mock_run: MagicMock,
+        _mock_sleep: MagicMock,
+        mock_restart: MagicMock,
+    ) -> None:
+        mock_run.side_effect = self._fake_run(running=False)
+        with self.assertRaises(HammerspoonError):
+            ensure_hammerspoon()
+        mock_restart.assert_called_once()
+
+    @patch("abu._wait_for_hammerspoon", return_value=True)
+    @patch("abu._restart_hammerspoon")
+    @patch("abu.subprocess.run")
+    @patch("abu.run_hs", side_effect=HammerspoonError("ipc hung"))
+    def test_running_with_hung_ipc_restarts_without_launching(
+        self,
+        _mock_hs: MagicMock,
+        mock_run: MagicMock,
+        mock_restart: MagicMock,
+        mock_wait: MagicMock,
+    ) -> None:
+        mock_run.side_effect = self._fake_run(running=True)
+        ensure_hammerspoon()
+        self.assertEqual(self._launches(mock_run), [])
+        mock_restart.assert_called_once()
+        mock_wait.assert_called_once_with(HS_RESTART_TIMEOUT_SECONDS)
+
+    @patch("abu._restart_hammerspoon")
+    @patch("abu.subprocess.run")
+    @patch("abu.run_hs", side_effect=HammerspoonCliNotFoundError("no hs"))
+    def test_missing_cli_raises_immediately(
+        self,
+        mock_hs: MagicMock,
+        mock_run: MagicMock,
+        mock_restart: MagicMock,
+    ) -> None:
+        with self.assertRaises(HammerspoonCliNotFoundError):
+            ensure_hammerspoon()
+        mock_hs.assert_called_once()
+        mock_run.assert_not_called()
+        mock_restart.assert_not_called()
+
+
+class TestIsPlayModeActive(unittest.TestCase):
+    """Test probing the Abu TCP port for play mode."""
+
+    def test_listening_port_is_active(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            self.assertTrue(is_play_mode_active(server.getsockname()[1]))
+
+    def test_closed_port_is_inactive(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self.assertFalse(is_play_mode_active(port))
+
+
 class TestSendMenuItemPidTargeted(unittest.TestCase):
     """Test PID-targeted vs bundle-ID Hammerspoon dispatch."""
 
@@ -2,11 +2,16 @@
 """Tests for worktree.py module."""
 
 import argparse
+import errno
+import io
 import json
 import os
+import subprocess
 import tempfile
 import unittest
+from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Callable
 from unittest.mock import MagicMock, patch
 
 from worktree import (
@@ -16,15 +21,25 @@ from worktree import (
     POOL_SLOTS,
     _is_worktree_available,
     _worktree_branch,
+    _worktree_list,
     allocate_port,
+    clone_item,
+    clone_items,
     cmd_claim,
+    cmd_refresh,
+    cmd_remove,
     cmd_reset,
     deallocate_port,
+    discover_untracked_items,
     dispatch,
+    find_main_repo,
+    get_fs_info,
     read_ports,
     register_subcommands,
+    remove_tree,
     resolve_worktree_path,
     should_exclude,
+    verify_apfs,
     write_ports,
 )
 
@@ -80,6 +95,242 @@ class TestShouldExclude(unittest.TestCase):
     def test_excludes_nested_tmp(self) -> None:
         self.assertTrue(should_exclude("foo/tmp"))
 
+    def test_does_not_exclude_path_prefix_sibling(self) -> None:
+        self.assertFalse(should_exclude("client/Temporary"))
+
+    def test_glob_must_match_whole_component(self) -> None:
+        self.assertFalse(should_exclude("notes.csproj.bak"))
+
+    def test_path_pattern_only_matches_from_root(self) -> None:
+        self.assertFalse(should_exclude("vendor/client/Temp"))
+
+
+class TestDiscoverUntrackedItems(unittest.TestCase):
+    """Test discovery of untracked and gitignored items with git ls-files."""
+
+    def test_lists_ignored_and_untracked_items(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir)
+            subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+            (repo / ".gitignore").write_text("target/\n")
+            (repo / "tracked.txt").write_text("x")
+            subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+            (repo / "target" / "debug").mkdir(parents=True)
+            (repo / "target" / "debug" / "out").write_text("x")
+            (repo / "new.txt").write_text("x")
+            (repo / "caf\u00e9 notes.txt").write_text("x")
+            expected = ["caf\u00e9 notes.txt", "new.txt", "target"]
+            self.assertEqual(discover_untracked_items(repo), expected)
+            with patch("worktree.LS_FILES_CHUNK_SIZE", 3):
+                self.assertEqual(discover_untracked_items(repo), expected)
+
+    def test_excluded_paths_filtered_by_git(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo = Path(tmpdir)
+            subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+            (repo / "client" / "Assets").mkdir(parents=True)
+            (repo / "client" / "Assets" / "tracked.txt").write_text("x")
+            subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+            for item in ["client/Temp/cache", "client/Temporary/cache"]:
+                (repo / item).parent.mkdir(parents=True)
+                (repo / item).write_text("x")
+            self.assertEqual(discover_untracked_items(repo), ["client/Temporary"])
+
+    def test_git_failure_raises(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(subprocess.CalledProcessError):
+                discover_untracked_items(Path(tmpdir))
+
+
+class TestCloneItem(unittest.TestCase):
+    """Test cloning of a single untracked item."""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_clones_directory_with_one_clonefile_call(self) -> None:
+        source = self.root / "src" / "target"
+        (source / "debug").mkdir(parents=True)
+        dest = self.root / "dest" / "target"
+        clonefile = MagicMock(return_value=0)
+        with patch("worktree.CLONEFILE", clonefile):
+            self.assertTrue(clone_item(source, dest, False))
+        clonefile.assert_called_once_with(os.fsencode(source), os.fsencode(dest), 0)
+
+    def test_clonefile_failure_skips_item(self) -> None:
+        source = self.root / "file.txt"
+        source.write_text("x")
+        with patch("worktree.CLONEFILE", MagicMock(return_value=-1)):
+            self.assertFalse(clone_item(source, self.root / "out" / "file.txt", False))
+
+    def test_existing_dest_skipped_without_warning(self) -> None:
+        source = self.root / "file.txt"
+        source.write_text("x")
+        with (
+            patch("worktree.CLONEFILE", MagicMock(return_value=-1)),
+            patch("worktree.ctypes.get_errno", return_value=errno.EEXIST),
+            patch("builtins.print") as mock_print,
+        ):
+            self.assertFalse(clone_item(source, self.root / "copy.txt", False))
+        mock_print.assert_not_called()
+
+    @patch("worktree.run_cmd")
+    def test_cp_fallback_skips_existing_dest(self, mock_run: MagicMock) -> None:
+        source = self.root / "dir"
+        source.mkdir()
+        dest = self.root / "existing"
+        dest.mkdir()
+        with patch("worktree.CLONEFILE", None):
+            self.assertFalse(clone_item(source, dest, False))
+        mock_run.assert_not_called()
+
+    @patch("worktree.run_cmd")
+    def test_falls_back_to_cp_without_clonefile(self, mock_run: MagicMock) -> None:
+        source = self.root / "file.txt"
+        source.write_text("x")
+        dest = self.root / "out" / "file.txt"
+        mock_run.return_value = MagicMock(returncode=0)
+        with patch("worktree.CLONEFILE", None):
+            self.assertTrue(clone_item(source, dest, False))
+        mock_run.assert_called_once_with(
+            ["cp", "-cR", str(source), str(dest)], check=False
+        )
+
+    def test_symlink_recreated_not_cloned(self) -> None:
+        source = self.root / "link"
+        source.symlink_to("missing-target")
+        dest = self.root / "link-copy"
+        clonefile = MagicMock(return_value=0)
+        with patch("worktree.CLONEFILE", clonefile):
+            self.assertTrue(clone_item(source, dest, False))
+        self.assertEqual(os.readlink(dest), "missing-target")
+        clonefile.assert_not_called()
+
+    def test_symlink_skips_existing_dest(self) -> None:
+        source = self.root / "link"
+        source.symlink_to("new-target")
+        dest = self.root / "link-copy"
+        dest.symlink_to("old-target")
+        self.assertFalse(clone_item(source, dest, False))
+        self.assertEqual(os.readlink(dest), "old-target")
+
+    def test_symlink_skips_existing_directory_dest(self) -> None:
+        source = self.root / "src" / "link"
+        source.parent.mkdir()
+        source.symlink_to("target")
+        dest_root = self.root / "dest"
+        (dest_root / "link").mkdir(parents=True)
+        self.assertEqual(clone_items(["link"], source.parent, dest_root, False), (0, 0))
+        self.assertTrue((dest_root / "link").is_dir())
+
+    def test_missing_source_returns_false(self) -> None:
+        self.assertFalse(clone_item(self.root / "missing", self.root / "dest", False))
+
+
+class TestCloneItems(unittest.TestCase):
+    """Test bulk cloning of discovered items."""
+
+    def test_counts_clones_and_exclusions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source_root = Path(tmpdir) / "repo"
+            dest_root = Path(tmpdir) / "wt"
+            for item in ["a", "b/target", "b/target/nested", "c"]:
+                (source_root / item).mkdir(parents=True)
+            (dest_root / "c").mkdir(parents=True)
+            clonefile = MagicMock(
+                side_effect=lambda src, dst, flags: -1 if os.path.lexists(dst) else 0
+            )
+            items = [".DS_Store", "a", "b/target", "b/target/nested", "c"]
+            with (
+                patch("worktree.CLONEFILE", clonefile),
+                patch("worktree.ctypes.get_errno", return_value=errno.EEXIST),
+            ):
+                cloned, excluded = clone_items(items, source_root, dest_root, False)
+            self.assertEqual((cloned, excluded), (2, 1))
+            self.assertTrue((dest_root / "b").is_dir())
+            cloned_dests = sorted(
+                call.args[1]
+                for call in clonefile.call_args_list
+                if call.args[1] != os.fsencode(dest_root / "c")
+            )
+            self.assertEqual(
+                cloned_dests,
+                [os.fsencode(dest_root / "a"), os.fsencode(dest_root / "b/target")],
+            )
+
+
+class TestVerifyApfs(unittest.TestCase):
+    """Test the APFS volume check."""
+
+    @patch.dict("worktree._apfs_by_device", clear=True)
+    @patch("worktree.run_cmd")
+    def test_result_cached_per_volume(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = MagicMock(
+            returncode=0, stdout="   File System Personality:  APFS\n"
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertTrue(verify_apfs(Path(tmpdir)))
+            self.assertTrue(verify_apfs(Path(tmpdir).parent))
+        mock_run.assert_called_once()
+
+    @patch.dict("worktree._apfs_by_device", clear=True)
+    @patch("worktree.run_cmd")
+    def test_falls_back_to_root_volume(self, mock_run: MagicMock) -> None:
+        mock_run.side_effect = [
+            MagicMock(returncode=1, stdout=""),
+            MagicMock(returncode=0, stdout="File System Personality: HFS+\n"),
+        ]
+        self.assertFalse(verify_apfs(Path("/nonexistent/volume")))
+        self.assertEqual(mock_run.call_args.args[0], ["diskutil", "info", "/"])
+
+
+class TestRemoveTree(unittest.TestCase):
+    """Test directory tree removal."""
+
+    def test_removes_tree(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = Path(tmpdir) / "wt"
+            (tree / "a" / "b").mkdir(parents=True)
+            (tree / "a" / "b" / "file").write_text("x")
+            remove_tree(tree)
+            self.assertFalse(tree.exists())
+
+    @patch("worktree.run_cmd")
+    def test_falls_back_to_rmtree_when_rm_fails(self, mock_run: MagicMock) -> None:
+        mock_run.return_value = MagicMock(returncode=1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tree = Path(tmpdir) / "wt"
+            (tree / "a").mkdir(parents=True)
+            remove_tree(tree)
+            self.assertFalse(tree.exists())
+
+
+class TestGetFsInfo(unittest.TestCase):
+    """Test reading the filesystem type and free space."""
+
+    def test_reads_type_and_free_space_from_statfs(self) -> None:
+        def fake_statfs(_path: bytes, fs: object) -> int:
+            contents = fs.contents  # type: ignore[attr-defined]
+            contents.f_bsize = 4096
+            contents.f_bavail = 2 * 1024**3 // 4096
+            contents.f_fstypename = b"apfs"
+            return 0
+
+        with patch("worktree.STATFS", fake_statfs):
+            self.assertEqual(get_fs_info(Path("/")), (True, 2.0))
+
+    @patch("worktree.get_free_gb", return_value=12.5)
+    @patch("worktree.verify_apfs", return_value=False)
+    def test_falls_back_without_statfs(
+        self, _mock_apfs: MagicMock, _mock_free: MagicMock
+    ) -> None:
+        with patch("worktree.STATFS", None):
+            self.assertEqual(get_fs_info(Path("/")), (False, 12.5))
+
 
 class TestPortAllocation(unittest.TestCase):
     """Test port allocation and deallocation."""
@@ -187,6 +438,12 @@ class TestResolveWorktreePath(unittest.TestCase):
 class TestWorktreeBranch(unittest.TestCase):
     """Test _worktree_branch helper."""
 
+    def setUp(self) -> None:
+        _worktree_list.cache_clear()
+
+    def tearDown(self) -> None:
+        _worktree_list.cache_clear()
+
     @patch("worktree.run_cmd")
     def test_finds_branch(self, mock_run: MagicMock) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -218,6 +475,19 @@ class TestWorktreeBranch(unittest.TestCase):
             result = _worktree_branch(Path(tmpdir) / "nonexistent")
             self.assertIsNone(result)
 
+    @patch("worktree.run_cmd")
+    def test_worktree_list_read_once(self, mock_run: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wt_path = Path(tmpdir) / "alpha"
+            wt_path.mkdir()
+            mock_run.return_value = MagicMock(
+                stdout=f"worktree {wt_path}\nbranch refs/heads/my-feature\n\n",
+            )
+            self.assertEqual(_worktree_branch(wt_path), "my-feature")
+            self.assertEqual(_worktree_branch(wt_path), "my-feature")
+            self.assertEqual(find_main_repo(), wt_path)
+        mock_run.assert_called_once()
+
 
 class TestIsWorktreeAvailable(unittest.TestCase):
     """Test _is_worktree_available helper."""
@@ -267,14 +537,12 @@ class TestCmdClaim(unittest.TestCase):
     @patch("worktree._claim_reuse")
     @patch("worktree._is_worktree_available")
     @patch("worktree._worktree_branch")
-    @patch("worktree.get_free_gb", return_value=50.0)
-    @patch("worktree.verify_apfs", return_value=True)
+    @patch("worktree.get_fs_info", return_value=(True, 50.0))
     @patch("worktree.DEFAULT_WORKTREE_BASE")
     def test_reuses_available_slot(
         self,
         mock_base: MagicMock,
-        mock_apfs: MagicMock,
-        mock_free: MagicMock,
+        mock_fs_info: MagicMock,
         mock_branch: MagicMock,
         mock_available: MagicMock,
         mock_reuse: MagicMock,
@@ -296,14 +564,12 @@ class TestCmdClaim(unittest.TestCase):
 
     @patch("worktree._claim_create")
     @patch("worktree._worktree_branch")
-    @patch("worktree.get_free_gb", return_value=50.0)
-    @patch("worktree.verify_apfs", return_value=True)
+    @patch("worktree.get_fs_info", return_value=(True, 50.0))
     @patch("worktree.DEFAULT_WORKTREE_BASE")
     def test_creates_new_slot(
         self,
         mock_base: MagicMock,
-        mock_apfs: MagicMock,
-        mock_free: MagicMock,
+        mock_fs_info: MagicMock,
         mock_branch: MagicMock,
         mock_create: MagicMock,
     ) -> None:
@@ -322,14 +588,12 @@ class TestCmdClaim(unittest.TestCase):
 
     @patch("worktree._is_worktree_available")
     @patch("worktree._worktree_branch")
-    @patch("worktree.get_free_gb", return_value=50.0)
-    @patch("worktree.verify_apfs", return_value=True)
+    @patch("worktree.get_fs_info", return_value=(True, 50.0))
     @patch("worktree.DEFAULT_WORKTREE_BASE")
     def test_all_occupied_error(
         self,
         mock_base: MagicMock,
-        mock_apfs: MagicMock,
-        mock_free: MagicMock,
+        mock_fs_info: MagicMock,
         mock_branch: MagicMock,
         mock_available: MagicMock,
     ) -> None:
@@ -345,14 +609,12 @@ class TestCmdClaim(unittest.TestCase):
                 cmd_claim(self._make_args())
 
     @patch("worktree._worktree_branch")
-    @patch("worktree.get_free_gb", return_value=50.0)
-    @patch("worktree.verify_apfs", return_value=True)
+    @patch("worktree.get_fs_info", return_value=(True, 50.0))
     @patch("worktree.DEFAULT_WORKTREE_BASE")
     def test_branch_conflict_error(
         self,
         mock_base: MagicMock,
-        mock_apfs: MagicMock,
-        mock_free: MagicMock,
+        mock_fs_info: MagicMock,
         mock_branch: MagicMock,
     ) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -480,6 +742,96 @@ class TestCmdReset(unittest.TestCase):
             mock_write_ports.assert_called_once_with({})
 
 
+class TestCmdRemove(unittest.TestCase):
+    """Test cmd_remove command."""
+
+    def _make_args(self, target: Path) -> argparse.Namespace:
+        return argparse.Namespace(target=str(target), delete_branch=True)
+
+    def _fake_git(self, rev_parse_output: str) -> Callable[..., MagicMock]:
+        def run(args: list[str], **_kwargs: object) -> MagicMock:
+            if args[:2] == ["git", "rev-parse"]:
+                return MagicMock(returncode=0, stdout=rev_parse_output)
+            return MagicMock(returncode=0)
+
+        return run
+
+    def _branch_deletions(self, mock_run: MagicMock) -> list[list[str]]:
+        return [
+            c[0][0]
+            for c in mock_run.call_args_list
+            if "branch" in c[0][0] and "-D" in c[0][0]
+        ]
+
+    @patch("worktree.deallocate_port")
+    @patch("worktree.run_cmd")
+    def test_deletes_checked_out_branch(
+        self, mock_run: MagicMock, _mock_dealloc: MagicMock
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wt_path = (Path(tmpdir) / "alpha").resolve()
+            wt_path.mkdir()
+            mock_run.side_effect = self._fake_git(f"{wt_path}\nmy-feature\n")
+            cmd_remove(self._make_args(wt_path))
+            self.assertEqual(
+                self._branch_deletions(mock_run),
+                [["git", "branch", "-D", "my-feature"]],
+            )
+
+    @patch("worktree.deallocate_port")
+    @patch("worktree.run_cmd")
+    def test_ignores_branch_of_enclosing_checkout(
+        self, mock_run: MagicMock, _mock_dealloc: MagicMock
+    ) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wt_path = (Path(tmpdir) / "alpha").resolve()
+            wt_path.mkdir()
+            mock_run.side_effect = self._fake_git(f"{tmpdir}\nmaster\n")
+            cmd_remove(self._make_args(wt_path))
+            self.assertEqual(self._branch_deletions(mock_run), [])
+
+
+class TestCmdRefresh(unittest.TestCase):
+    """Test cmd_refresh command."""
+
+    @patch("worktree.get_free_gb", return_value=50.0)
+    @patch("worktree.discover_untracked_items", return_value=["target"])
+    @patch("worktree.refresh_one_worktree")
+    @patch("worktree.list_worktree_paths")
+    @patch("worktree.find_main_repo", return_value=Path("/repo"))
+    def test_all_prints_each_worktree_report_in_order(
+        self,
+        _mock_main: MagicMock,
+        mock_list: MagicMock,
+        mock_refresh: MagicMock,
+        _mock_discover: MagicMock,
+        _mock_free: MagicMock,
+    ) -> None:
+        names = ["alpha", "beta", "gamma"]
+        mock_list.return_value = [Path("/wt") / name for name in names]
+
+        def refresh(
+            worktree_path: Path,
+            _main_repo: Path,
+            _items: list[str],
+            _dry_run: bool,
+            out: io.StringIO,
+        ) -> None:
+            print(f"Refreshing worktree: {worktree_path}", file=out)
+            print(f"  done {worktree_path.name}", file=out)
+
+        mock_refresh.side_effect = refresh
+        args = argparse.Namespace(dry_run=False, build=False, all=True, target=None)
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            cmd_refresh(args)
+        self.assertEqual(mock_refresh.call_count, 3)
+        reports = [
+            f"Refreshing worktree: /wt/{name}\n  done {name}\n" for name in names
+        ]
+        self.assertIn("\n".join(reports), stdout.getvalue())
+
+
 class TestRegisterSubcommands(unittest.TestCase):
     """Test that subcommands are correctly registered."""
 
@@ -9,13 +9,20 @@ setup with warm caches at negligible disk cost.
 from __future__ import annotations
 
 import argparse
-import fnmatch
+import ctypes
+import errno
+import functools
+import io
 import json
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Iterator, TextIO
 
 REPO_ROOT: Path = Path(__file__).resolve().parent.parent.parent
 DEFAULT_WORKTREE_BASE: Path = Path.home() / "dreamtides-worktrees"
@@ -49,9 +56,39 @@ EXCLUDE: set[str] = {
     "*.private.0",
 }
 
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a single-component glob (* and ?) into a regex fragment."""
+    return "".join(
+        "[^/]*" if char == "*" else "[^/]" if char == "?" else re.escape(char)
+        for char in pattern
+    )
+
+
+# Path patterns exclude a repo-relative path and everything beneath it; the rest
+# are globs matched against any single path component. Both are folded into one
+# regex so should_exclude is a single search.
+EXCLUDE_RE: re.Pattern[str] = re.compile(
+    "^(?:"
+    + "|".join(re.escape(pattern) for pattern in sorted(EXCLUDE) if "/" in pattern)
+    + ")(?:/|$)|(?:^|/)(?:"
+    + "|".join(
+        _glob_to_regex(pattern) for pattern in sorted(EXCLUDE) if "/" not in pattern
+    )
+    + ")(?:/|$)"
+)
+
+# Path patterns are also handed to git ls-files, so excluded subtrees such as
+# client/Temp are never walked or listed at all.
+LS_FILES_EXCLUDE_PATHSPECS: tuple[str, ...] = tuple(
+    f":(exclude){pattern}" for pattern in sorted(EXCLUDE) if "/" in pattern
+)
+
 MIN_FREE_GB: int = 2
 WARN_FREE_GB: int = 5
 POOL_SLOTS: tuple[str, ...] = ("alpha", "beta", "gamma")
+CLONE_WORKERS: int = min(8, os.cpu_count() or 4)
+LS_FILES_CHUNK_SIZE: int = 65536
 
 
 def run_cmd(
@@ -70,10 +107,105 @@ def run_cmd(
     )
 
 
+class StatFs(ctypes.Structure):
+    """struct statfs from <sys/mount.h>, in its 64-bit inode layout."""
+
+    _fields_ = [
+        ("f_bsize", ctypes.c_uint32),
+        ("f_iosize", ctypes.c_int32),
+        ("f_blocks", ctypes.c_uint64),
+        ("f_bfree", ctypes.c_uint64),
+        ("f_bavail", ctypes.c_uint64),
+        ("f_files", ctypes.c_uint64),
+        ("f_ffree", ctypes.c_uint64),
+        ("f_fsid", ctypes.c_int32 * 2),
+        ("f_owner", ctypes.c_uint32),
+        ("f_type", ctypes.c_uint32),
+        ("f_flags", ctypes.c_uint32),
+        ("f_fssubtype", ctypes.c_uint32),
+        ("f_fstypename", ctypes.c_char * 16),
+        ("f_mntonname", ctypes.c_char * 1024),
+        ("f_mntfromname", ctypes.c_char * 1024),
+        ("f_flags_ext", ctypes.c_uint32),
+        ("f_reserved", ctypes.c_uint32 * 7),
+    ]
+
+
+def _load_libsystem() -> Any:
+    """Load libSystem, or return None where it is unavailable."""
+    try:
+        return ctypes.CDLL("/usr/lib/libSystem.B.dylib", use_errno=True)
+    except OSError:
+        return None
+
+
+def _load_clonefile(libc: Any) -> Any:
+    """Bind clonefile(2) from libSystem, or return None where it is unavailable."""
+    clonefile = getattr(libc, "clonefile", None)
+    if clonefile is None:
+        return None
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def _load_statfs(libc: Any) -> Any:
+    """Bind the 64-bit inode statfs(2), or return None where it is unavailable.
+
+    Intel Macs export it as statfs$INODE64; Apple silicon only has statfs.
+    """
+    for name in ("statfs$INODE64", "statfs"):
+        statfs = getattr(libc, name, None)
+        if statfs is not None:
+            statfs.argtypes = [ctypes.c_char_p, ctypes.POINTER(StatFs)]
+            statfs.restype = ctypes.c_int
+            return statfs
+    return None
+
+
+LIBSYSTEM: Any = _load_libsystem()
+CLONEFILE: Any = _load_clonefile(LIBSYSTEM)
+STATFS: Any = _load_statfs(LIBSYSTEM)
+
+
+def apfs_clone(source: Path, dest: Path) -> bool:
+    """APFS-clone a file or directory tree. Returns True on success.
+
+    Calls clonefile(2) directly, which clones a whole directory tree in one
+    syscall. Falls back to cp -cR where libSystem cannot be loaded. Raises
+    FileExistsError if dest already exists.
+    """
+    if CLONEFILE is not None:
+        if CLONEFILE(os.fsencode(source), os.fsencode(dest), 0) == 0:
+            return True
+        if ctypes.get_errno() == errno.EEXIST:
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dest))
+        return False
+    # cp -R copies into an existing directory rather than failing
+    if os.path.lexists(dest):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dest))
+    result = run_cmd(["cp", "-cR", str(source), str(dest)], check=False)
+    return result.returncode == 0
+
+
 def get_free_gb(path: Path) -> float:
     """Return free disk space in GB for the volume containing path."""
-    stat = os.statvfs(path)
-    return (stat.f_bavail * stat.f_frsize) / (1024**3)
+    fs_stat = os.statvfs(path)
+    return (fs_stat.f_bavail * fs_stat.f_frsize) / (1024**3)
+
+
+def get_fs_info(path: Path) -> tuple[bool, float]:
+    """Return (is_apfs, free_gb) for the volume containing path.
+
+    Reads both from a single statfs(2) call where libSystem is available,
+    falling back to verify_apfs and get_free_gb otherwise.
+    """
+    if STATFS is not None:
+        fs = StatFs()
+        if STATFS(os.fsencode(path), ctypes.pointer(fs)) == 0:
+            free_gb: float = (fs.f_bavail * fs.f_bsize) / (1024**3)
+            return fs.f_fstypename == b"apfs", free_gb
+    return verify_apfs(path), get_free_gb(path)
 
 
 def read_ports() -> dict[str, int]:
@@ -112,8 +244,22 @@ def deallocate_port(name: str) -> None:
         write_ports(ports)
 
 
+_apfs_by_device: dict[int, bool] = {}
+
+
 def verify_apfs(path: Path) -> bool:
-    """Verify the volume containing path is APFS."""
+    """Verify the volume containing path is APFS.
+
+    The answer is cached per device for the rest of the process, since it is
+    a property of the volume rather than of the path.
+    """
+    try:
+        device: int = os.stat(path).st_dev
+    except OSError:
+        device = -1
+    if device in _apfs_by_device:
+        return _apfs_by_device[device]
+
     result = run_cmd(
         ["diskutil", "info", str(path)],
         capture=True,
@@ -125,122 +271,173 @@ def verify_apfs(path: Path) -> bool:
             capture=True,
             check=False,
         )
-    return "APFS" in result.stdout
+    is_apfs: bool = "APFS" in result.stdout
+    _apfs_by_device[device] = is_apfs
+    return is_apfs
 
 
+@functools.lru_cache(maxsize=None)
 def should_exclude(item_path: str) -> bool:
-    """Check if an item should be excluded from cloning."""
-    clean: str = item_path.rstrip("/")
-    parts: list[str] = clean.split("/")
-    for pattern in EXCLUDE:
-        if "/" in pattern:
-            if clean == pattern or clean.startswith(pattern + "/"):
-                return True
-        else:
-            for part in parts:
-                if fnmatch.fnmatch(part, pattern):
-                    return True
-    return False
+    """Check if an item should be excluded from cloning.
 
+    Memoized, since refresh --all checks the same item list for every worktree.
+    """
+    return EXCLUDE_RE.search(item_path.rstrip("/")) is not None
 
-def discover_untracked_items(repo: Path) -> list[str]:
-    """Discover all untracked/gitignored items in the repo."""
-    result = run_cmd(
-        [
-            "git",
-            "ls-files",
-            "--others",
-            "--ignored",
-            "--directory",
-            "--exclude-standard",
-        ],
-        capture=True,
-        cwd=repo,
-    )
-    ignored: set[str] = (
-        set(result.stdout.strip().splitlines()) if result.stdout.strip() else set()
-    )
 
-    result = run_cmd(
-        [
-            "git",
-            "ls-files",
-            "--others",
-            "--directory",
-            "--exclude-standard",
-        ],
-        capture=True,
-        cwd=repo,
-    )
-    untracked: set[str] = (
-        set(result.stdout.strip().splitlines()) if result.stdout.strip() else set()
-    )
+def iter_untracked_items(repo: Path) -> Iterator[str]:
+    """Yield untracked/gitignored items as git ls-files reports them.
 
-    all_items: list[str] = sorted(ignored | untracked)
-    return [item.rstrip("/") for item in all_items if item.strip()]
+    Without --exclude-standard, a single git ls-files --others lists ignored
+    and non-ignored untracked items together, collapsing untracked directories
+    to one entry. Excluded path patterns are passed as pathspecs so git skips
+    those subtrees itself. Paths are NUL-terminated so git does not quote them,
+    and are read from the pipe as raw bytes in chunks rather than buffered
+    whole. Each path is decoded on its own with the filesystem encoding, so
+    names that are not valid UTF-8 round-trip back to the same bytes.
+    """
+    args: list[str] = [
+        "git",
+        "ls-files",
+        "-z",
+        "--others",
+        "--directory",
+        "--",
+        ".",
+        *LS_FILES_EXCLUDE_PATHSPECS,
+    ]
+    with subprocess.Popen(args, stdout=subprocess.PIPE, cwd=repo) as proc:
+        assert proc.stdout is not None
+        pending: bytes = b""
+        while chunk := proc.stdout.read(LS_FILES_CHUNK_SIZE):
+            *paths, pending = (pending + chunk).split(b"\0")
+            for path in paths:
+                if path:
+                    yield os.fsdecode(path.rstrip(b"/"))
+        if pending:
+            yield os.fsdecode(pending.rstrip(b"/"))
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, args)
 
 
-def clone_item(source: Path, dest: Path, dry_run: bool) -> bool:
-    """APFS-clone a single item from source to dest. Returns True on success."""
-    if not source.exists() and not source.is_symlink():
-        return False
+def discover_untracked_items(repo: Path) -> list[str]:
+    """Discover all untracked/gitignored items in the repo, sorted."""
+    return sorted(iter_untracked_items(repo))
 
-    if not dry_run:
-        dest.parent.mkdir(parents=True, exist_ok=True)
 
-    if source.is_symlink():
-        target: Path = Path(os.readlink(source))
-        if dry_run:
-            print(f"  [symlink] {dest} -> {target}")
-        else:
-            if dest.exists() or dest.is_symlink():
-                dest.unlink()
-            dest.symlink_to(target)
-        return True
+def clone_item(source: Path, dest: Path, dry_run: bool) -> bool:
+    """APFS-clone a single item from source to dest. Returns True on success.
 
-    resolved: Path = source.resolve()
-    if not resolved.exists():
+    The parent of dest must already exist. An existing dest is left alone and
+    counts as a skip.
+    """
+    try:
+        source_stat: os.stat_result = os.lstat(source)
+    except OSError:
         return False
 
-    if resolved.is_dir():
+    if stat.S_ISLNK(source_stat.st_mode):
+        target: bytes = os.readlink(os.fsencode(source))
         if dry_run:
-            print(f"  [dir-clone] {dest}")
+            print(f"  [symlink] {dest} -> {os.fsdecode(target)}")
         else:
-            result = run_cmd(
-                ["cp", "-cR", str(resolved), str(dest)],
-                check=False,
-            )
-            if result.returncode != 0:
-                print(f"  Warning: APFS clone failed for {source}, skipping")
+            try:
+                os.symlink(target, os.fsencode(dest))
+            except FileExistsError:
                 return False
+        return True
+
+    if dry_run:
+        label: str = "dir-clone" if stat.S_ISDIR(source_stat.st_mode) else "file-clone"
+        print(f"  [{label}] {dest}")
     else:
-        if dry_run:
-            print(f"  [file-clone] {dest}")
-        else:
-            result = run_cmd(
-                ["cp", "-c", str(resolved), str(dest)],
-                check=False,
-            )
-            if result.returncode != 0:
-                print(f"  Warning: APFS clone failed for {source}, skipping")
-                return False
+        try:
+            cloned: bool = apfs_clone(source, dest)
+        except FileExistsError:
+            return False
+        if not cloned:
+            print(f"  Warning: APFS clone failed for {source}, skipping")
+            return False
 
     return True
 
 
-def find_main_repo() -> Path:
-    """Find the main (non-worktree) repo root via git worktree list."""
+def clone_items(
+    items: list[str], source_root: Path, dest_root: Path, dry_run: bool
+) -> tuple[int, int]:
+    """Clone untracked items from source_root into dest_root.
+
+    Exclusion checks run up front so only real clones reach the thread pool,
+    where clonefile calls run concurrently. Items whose dest already exists
+    are skipped when clonefile reports EEXIST, saving an lstat per item. Items nested under
+    another listed item are left to that item's clone. Dry runs stay serial so
+    their output keeps the item order. Returns (cloned, excluded) counts.
+    """
+    excluded: int = 0
+    to_clone: list[str] = []
+    listed: set[str] = set(items)
+    for item in items:
+        if should_exclude(item):
+            excluded += 1
+            continue
+        parts: list[str] = item.split("/")
+        if any("/".join(parts[:i]) in listed for i in range(1, len(parts))):
+            continue
+        if dry_run and os.path.lexists(dest_root / item):
+            continue
+        to_clone.append(item)
+
+    if not dry_run:
+        parents: set[Path] = {(dest_root / item).parent for item in to_clone}
+        for parent in sorted(parents):
+            parent.mkdir(parents=True, exist_ok=True)
+
+    def clone(item: str) -> bool:
+        return clone_item(source_root / item, dest_root / item, dry_run)
+
+    if dry_run:
+        results: list[bool] = [clone(item) for item in to_clone]
+    else:
+        with ThreadPoolExecutor(max_workers=CLONE_WORKERS) as executor:
+            results = list(executor.map(clone, to_clone))
+    return sum(results), excluded
+
+
+@functools.lru_cache(maxsize=1)
+def _worktree_list() -> tuple[str, ...]:
+    """Return the lines of git worktree list --porcelain, read once per run.
+
+    Each abu invocation runs a single command, and the entries later lookups
+    depend on (the main repo and existing worktrees) are not changed by it.
+    """
     result = run_cmd(
         ["git", "worktree", "list", "--porcelain"],
         capture=True,
+        cwd=REPO_ROOT,
     )
-    for line in result.stdout.splitlines():
+    return tuple(result.stdout.splitlines())
+
+
+def find_main_repo() -> Path:
+    """Find the main (non-worktree) repo root via git worktree list."""
+    for line in _worktree_list():
         if line.startswith("worktree "):
             return Path(line.split(" ", 1)[1])
     print("Error: Could not find main worktree")
     sys.exit(1)
 
 
+def remove_tree(path: Path) -> None:
+    """Delete a directory tree, preferring rm -rf over shutil.rmtree.
+
+    rm walks and unlinks the tree in C; shutil.rmtree is kept as the fallback
+    if rm fails or leaves anything behind.
+    """
+    result = run_cmd(["rm", "-rf", str(path)], check=False)
+    if result.returncode != 0 or path.exists():
+        shutil.rmtree(path, ignore_errors=True)
+
+
 def cleanup_worktree(worktree_path: Path) -> None:
     """Clean up a partially created worktree."""
     run_cmd(
@@ -249,7 +446,7 @@ def cleanup_worktree(worktree_path: Path) -> None:
         cwd=REPO_ROOT,
     )
     if worktree_path.exists():
-        shutil.rmtree(worktree_path, ignore_errors=True)
+        remove_tree(worktree_path)
 
 
 def cmd_create(args: argparse.Namespace) -> None:
@@ -264,15 +461,14 @@ def cmd_create(args: argparse.Namespace) -> None:
     else:
         worktree_path = DEFAULT_WORKTREE_BASE / branch
 
-    if not verify_apfs(
+    volume_path: Path = (
         worktree_path.parent if worktree_path.parent.exists() else Path.home()
-    ):
+    )
+    is_apfs, free_gb = get_fs_info(volume_path)
+    if not is_apfs:
         print("Error: Filesystem is not APFS. APFS clones require an APFS volume.")
         sys.exit(1)
 
-    free_gb: float = get_free_gb(
-        worktree_path.parent if worktree_path.parent.exists() else Path.home()
-    )
     if free_gb < MIN_FREE_GB:
         print(f"Error: Only {free_gb:.1f}GB free. Need at least {MIN_FREE_GB}GB.")
         sys.exit(1)
@@ -307,23 +503,7 @@ def cmd_create(args: argparse.Namespace) -> None:
     print("Discovering untracked/gitignored items...")
     items: list[str] = discover_untracked_items(REPO_ROOT)
 
-    clone_count: int = 0
-    skip_count: int = 0
-
-    for item in items:
-        if should_exclude(item):
-            skip_count += 1
-            continue
-
-        source: Path = REPO_ROOT / item
-        dest: Path = worktree_path / item
-
-        if dest.exists() or dest.is_symlink():
-            continue
-
-        success: bool = clone_item(source, dest, dry_run)
-        if success:
-            clone_count += 1
+    clone_count, skip_count = clone_items(items, REPO_ROOT, worktree_path, dry_run)
 
     print(f"\nDone! Worktree ready at: {worktree_path}")
     print(f"  Branch: {branch}")
@@ -350,22 +530,22 @@ def cmd_remove(args: argparse.Namespace) -> None:
 
     branch_name: str | None = None
     if delete_branch:
+        # Only trust the branch if target_path is itself a worktree root, so a
+        # subdirectory of another checkout never yields that checkout's branch.
         result = run_cmd(
-            ["git", "worktree", "list", "--porcelain"],
+            ["git", "rev-parse", "--show-toplevel", "--abbrev-ref", "HEAD"],
             capture=True,
-            cwd=REPO_ROOT,
+            check=False,
+            cwd=target_path,
         )
         lines: list[str] = result.stdout.splitlines()
-        for i, line in enumerate(lines):
-            if (
-                line.startswith("worktree ")
-                and Path(line.split(" ", 1)[1]).resolve() == target_path
-            ):
-                for j in range(i + 1, min(i + 5, len(lines))):
-                    if lines[j].startswith("branch refs/heads/"):
-                        branch_name = lines[j].removeprefix("branch refs/heads/")
-                        break
-                break
+        if (
+            result.returncode == 0
+            and len(lines) == 2
+            and Path(lines[0]).resolve() == target_path
+            and lines[1] != "HEAD"
+        ):
+            branch_name = lines[1]
 
     print(f"Removing worktree: {target_path}")
     result = run_cmd(
@@ -375,10 +555,9 @@ def cmd_remove(args: argparse.Namespace) -> None:
     )
     if result.returncode != 0:
         print("git worktree remove failed, falling back to rm -rf")
-        shutil.rmtree(target_path, ignore_errors=True)
 
     if target_path.exists():
-        shutil.rmtree(target_path, ignore_errors=True)
+        remove_tree(target_path)
 
     # Deallocate port for this worktree
     deallocate_port(target_path.name)
@@ -413,14 +592,10 @@ def resolve_worktree_path(target: str | None) -> Path:
 
 def list_worktree_paths() -> list[Path]:
     """Return paths of all worktrees under the default base directory."""
-    result = run_cmd(
-        ["git", "worktree", "list", "--porcelain"],
-        capture=True,
-    )
     main_repo: Path = find_main_repo().resolve()
     wt_base: Path = DEFAULT_WORKTREE_BASE.resolve()
     paths: list[Path] = []
-    for line in result.stdout.splitlines():
+    for line in _worktree_list():
         if line.startswith("worktree "):
             wt_path: Path = Path(line.split(" ", 1)[1]).resolve()
             if wt_path != main_repo and str(wt_path).startswith(str(wt_base)):
@@ -508,7 +683,7 @@ def sync_tree(
             if not dry_run:
                 if dest_file.exists() or dest_file.is_symlink():
                     dest_file.unlink()
-                run_cmd(["cp", "-c", str(src_file), str(dest_file)], check=False)
+                apfs_clone(src_file, dest_file)
             cloned += 1
 
     # Delete files in dest that don't exist in source
@@ -517,7 +692,7 @@ def sync_tree(
         if dest_file.exists() or dest_file.is_symlink():
             if not dry_run:
                 if dest_file.is_dir() and not dest_file.is_symlink():
-                    shutil.rmtree(dest_file, ignore_errors=True)
+                    remove_tree(dest_file)
                 else:
                     dest_file.unlink()
             deleted += 1
@@ -537,9 +712,13 @@ def refresh_one_worktree(
     main_repo: Path,
     items: list[str],
     dry_run: bool,
+    out: TextIO | None = None,
 ) -> None:
-    """Refresh a single worktree by incrementally syncing gitignored directories."""
-    print(f"Refreshing worktree: {worktree_path}")
+    """Refresh a single worktree by incrementally syncing gitignored directories.
+
+    Progress is written to out, or stdout when it is None.
+    """
+    print(f"Refreshing worktree: {worktree_path}", file=out)
 
     total_cloned: int = 0
     total_deleted: int = 0
@@ -583,12 +762,14 @@ def refresh_one_worktree(
         total_unchanged += unchanged
         if cloned > 0 or deleted > 0:
             print(
-                f"  {item}: {cloned} cloned, {deleted} deleted, {unchanged} unchanged"
+                f"  {item}: {cloned} cloned, {deleted} deleted, {unchanged} unchanged",
+                file=out,
             )
         dir_count += 1
 
     print(
-        f"  Synced {dir_count} directories: {total_cloned} cloned, {total_deleted} deleted, {total_unchanged} unchanged"
+        f"  Synced {dir_count} directories: {total_cloned} cloned, {total_deleted} deleted, {total_unchanged} unchanged",
+        file=out,
     )
 
 
@@ -610,12 +791,8 @@ def cmd_refresh(args: argparse.Namespace) -> None:
         if wt_path == main_repo:
             print("Error: Cannot refresh the main repo itself.")
             sys.exit(1)
-        result = run_cmd(
-            ["git", "worktree", "list", "--porcelain"],
-            capture=True,
-        )
         is_worktree: bool = False
-        for line in result.stdout.splitlines():
+        for line in _worktree_list():
             if (
                 line.startswith("worktree ")
                 and Path(line.split(" ", 1)[1]).resolve() == wt_path
@@ -655,10 +832,22 @@ def cmd_refresh(args: argparse.Namespace) -> None:
 
     items: list[str] = discover_untracked_items(main_repo)
 
-    for i, worktree_path in enumerate(worktree_paths):
-        if i > 0:
-            print()
-        refresh_one_worktree(worktree_path, main_repo, items, dry_run)
+    if len(worktree_paths) == 1:
+        refresh_one_worktree(worktree_paths[0], main_repo, items, dry_run)
+    else:
+        # Worktrees are refreshed concurrently; each one's output is buffered
+        # and printed in order so the reports do not interleave.
+        def refresh(worktree_path: Path) -> str:
+            out = io.StringIO()
+            refresh_one_worktree(worktree_path, main_repo, items, dry_run, out)
+            return out.getvalue()
+
+        workers: int = min(CLONE_WORKERS, len(worktree_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for i, output in enumerate(executor.map(refresh, worktree_paths)):
+                if i > 0:
+                    print()
+                print(output, end="")
 
     if not dry_run:
         print(f"\nFree disk: {get_free_gb(main_repo):.1f}GB")
@@ -742,7 +931,7 @@ def cmd_activate(args: argparse.Namespace) -> None:
                     dest.parent.mkdir(parents=True, exist_ok=True)
                     if dest.exists() or dest.is_symlink():
                         if dest.is_dir() and not dest.is_symlink():
-                            shutil.rmtree(dest)
+                            remove_tree(dest)
                         else:
                             dest.unlink()
                     dest.symlink_to(target)
@@ -766,6 +955,8 @@ def cmd_activate(args: argparse.Namespace) -> None:
                     )
             else:
                 # Exists in main only: fresh APFS clone
+                if not dry_run:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
                 if clone_item(source, dest, dry_run):
                     total_cloned += 1
                     print(f"  {item}: cloned (new)")
@@ -784,6 +975,11 @@ def cmd_activate(args: argparse.Namespace) -> None:
                         continue
                 except OSError:
                     pass
+                # clonefile does not overwrite, so replace the stale copy
+                if not dry_run and not dest.is_dir():
+                    dest.unlink()
+            if not dry_run:
+                dest.parent.mkdir(parents=True, exist_ok=True)
             if clone_item(source, dest, dry_run):
                 total_cloned += 1
 
@@ -798,7 +994,7 @@ def cmd_activate(args: argparse.Namespace) -> None:
             if dest.exists() or dest.is_symlink():
                 if not dry_run:
                     if dest.is_dir() and not dest.is_symlink():
-                        shutil.rmtree(dest, ignore_errors=True)
+                        remove_tree(dest)
                     else:
                         dest.unlink()
                 print(f"  Removed extra: {item}")
@@ -826,13 +1022,8 @@ def _eprint(*args: object) -> None:
 
 def _worktree_branch(worktree_path: Path) -> str | None:
     """Get the branch checked out in a worktree, or None if detached/unknown."""
-    result = run_cmd(
-        ["git", "worktree", "list", "--porcelain"],
-        capture=True,
-        cwd=REPO_ROOT,
-    )
     resolved: Path = worktree_path.resolve()
-    lines: list[str] = result.stdout.splitlines()
+    lines: tuple[str, ...] = _worktree_list()
     for i, line in enumerate(lines):
         if (
             line.startswith("worktree ")
@@ -897,7 +1088,7 @@ def _sync_gitignored(worktree_path: Path, main_repo: Path) -> None:
                 dest.parent.mkdir(parents=True, exist_ok=True)
                 if dest.exists() or dest.is_symlink():
                     if dest.is_dir() and not dest.is_symlink():
-                        shutil.rmtree(dest)
+                        remove_tree(dest)
                     else:
                         dest.unlink()
                 dest.symlink_to(target)
@@ -919,6 +1110,7 @@ def _sync_gitignored(worktree_path: Path, main_repo: Path) -> None:
                         f"  {item}: {cloned} cloned, {deleted_count} deleted, {unchanged} unchanged"
                     )
             else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
                 if clone_item(source, dest, False):
                     total_cloned += 1
                     _eprint(f"  {item}: cloned (new)")
@@ -936,6 +1128,10 @@ def _sync_gitignored(worktree_path: Path, main_repo: Path) -> None:
                         continue
                 except OSError:
                     pass
+                # clonefile does not overwrite, so replace the stale copy
+                if not dest.is_dir():
+                    dest.unlink()
+            dest.parent.mkdir(parents=True, exist_ok=True)
             if clone_item(source, dest, False):
                 total_cloned += 1
 
@@ -948,7 +1144,7 @@ def _sync_gitignored(worktree_path: Path, main_repo: Path) -> None:
             dest = worktree_path / item
             if dest.exists() or dest.is_symlink():
                 if dest.is_dir() and not dest.is_symlink():
-                    shutil.rmtree(dest, ignore_errors=True)
+                    remove_tree(dest)
                 else:
                     dest.unlink()
                 _eprint(f"  Removed extra: {item}")
@@ -1006,23 +1202,7 @@ def _claim_create(worktree_path: Path, slot: str, branch: str, base: str) -> Non
     _eprint("Discovering untracked/gitignored items...")
     items: list[str] = discover_untracked_items(main_repo)
 
-    clone_count: int = 0
-    skip_count: int = 0
-
-    for item in items:
-        if should_exclude(item):
-            skip_count += 1
-            continue
-
-        source: Path = main_repo / item
-        dest: Path = worktree_path / item
-
-        if dest.exists() or dest.is_symlink():
-            continue
-
-        success: bool = clone_item(source, dest, False)
-        if success:
-            clone_count += 1
+    clone_count, skip_count = clone_items(items, main_repo, worktree_path, False)
 
     _eprint(f"  Cloned: {clone_count} items, excluded: {skip_count} items")
 
@@ -1055,10 +1235,9 @@ def cmd_reset(args: argparse.Namespace) -> None:
         )
         if result.returncode != 0:
             print(f"    git worktree remove failed, falling back to rm -rf")
-            shutil.rmtree(worktree_path, ignore_errors=True)
 
         if worktree_path.exists():
-            shutil.rmtree(worktree_path, ignore_errors=True)
+            remove_tree(worktree_path)
 
         if branch and branch != "master" and branch != "main":
             branches_to_delete.append(branch)
@@ -1180,11 +1359,11 @@ def cmd_claim(args: argparse.Namespace) -> None:
     branch: str = args.branch
     base: str = args.base
 
-    if not verify_apfs(Path.home()):
+    is_apfs, free_gb = get_fs_info(Path.home())
+    if not is_apfs:
         _eprint("Error: Filesystem is not APFS. APFS clones require an APFS volume.")
         sys.exit(1)
 
-    free_gb: float = get_free_gb(Path.home())
     if free_gb < MIN_FREE_GB:
         _eprint(f"Error: Only {free_gb:.1f}GB free. Need at least {MIN_FREE_GB}GB.")
         sys.exit(1)
@@ -6,23 +6,40 @@ Returns exit code 1 if they do not match, 0 if they match.
 Setup:
   brew install pipx
   pipx install oletools
+  pip install cdifflib  # optional, speeds up diffs of large modules
 """
 
 import argparse
+import os
+import shutil
 import subprocess
 import sys
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List
 
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
-def find_project_root(start_path: Path) -> Optional[Path]:
-    """Find the project root by looking for a justfile."""
-    current = start_path.resolve()
-    while current != current.parent:
-        if (current / "justfile").exists():
-            return current
-        current = current.parent
-    return None
+from _common import find_project_root
+
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
+_DIVIDER = b"-" * 79
+_VBA_MACRO = b"VBA MACRO "
+_IGNORE_IN_VBA = (b"- - - - -", b"in file:")
+_ANALYSIS_TABLE_ROW = ("|", "+")
+_SKIP_ATTR = ("Attribute VB_", "VBA Stomping detection is experimental")
+
+OLEVBA_CACHE_FILE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "dreamtides"
+    / "olevba-ok"
+)
 
 
 def main():
@@ -64,8 +81,14 @@ def main():
 
     try:
         check_olevba_installed()
-        extracted_modules = extract_vba_from_excel(args.excel_file)
-        source_modules = read_bas_files(args.vba_dir)
+        olevba_process = start_olevba(args.excel_file)
+        try:
+            source_modules = read_bas_files(args.vba_dir)
+            extracted_modules = finish_olevba(olevba_process)
+        except BaseException:
+            olevba_process.kill()
+            olevba_process.wait()
+            raise
         compare_modules(extracted_modules, source_modules)
         print("✓ All VBA modules match!")
     except Exception as e:
@@ -74,10 +97,27 @@ def main():
 
 
 def check_olevba_installed():
-    """Verify that olevba is installed and available."""
+    """Verify that olevba is installed and available.
+
+    A successful probe is recorded in OLEVBA_CACHE_FILE keyed by the binary's
+    path and mtime, so later runs skip the subprocess until olevba changes.
+    """
+    olevba_path = shutil.which("olevba")
+    if not olevba_path:
+        raise RuntimeError(
+            "olevba not found. Please install it with: pipx install oletools"
+        )
+
+    cache_key = f"{olevba_path}\n{os.stat(olevba_path).st_mtime_ns}\n"
+    try:
+        if OLEVBA_CACHE_FILE.read_text() == cache_key:
+            return
+    except OSError:
+        pass
+
     try:
         result = subprocess.run(
-            ["olevba", "-h"],
+            [olevba_path, "-h"],
             capture_output=True,
             text=True,
             check=False,
@@ -91,62 +131,91 @@ def check_olevba_installed():
             "olevba not found. Please install it with: pipx install oletools"
         )
 
+    try:
+        OLEVBA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        OLEVBA_CACHE_FILE.write_text(cache_key)
+    except OSError:
+        pass
+
 
-def extract_vba_from_excel(excel_path: Path) -> Dict[str, Dict[str, str]]:
-    """Extract VBA modules from an Excel file using olevba."""
+def start_olevba(excel_path: Path) -> subprocess.Popen:
+    """Start extracting VBA modules from an Excel file using olevba.
+
+    The process runs in the background so that callers can read the source
+    .bas files while olevba decodes the workbook.
+    """
     print(f"Extracting VBA modules from {excel_path}...")
 
-    result = subprocess.run(
+    return subprocess.Popen(
         ["olevba", "--decode", str(excel_path)],
-        capture_output=True,
-        text=True,
-        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
     )
 
-    if result.returncode != 0:
-        raise RuntimeError(f"olevba failed: {result.stderr}")
 
-    return parse_olevba_output(result.stdout)
+def finish_olevba(process: subprocess.Popen) -> Dict[str, Dict[str, str]]:
+    """Wait for an olevba process started by start_olevba and parse its output.
 
+    stderr is drained on a helper thread while stdout is parsed, so olevba
+    cannot block on a full stderr pipe.
+    """
+    assert process.stdout is not None and process.stderr is not None
+    stderr_pipe = process.stderr
+    stderr_chunks: List[bytes] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(stderr_pipe.read()), daemon=True
+    )
+    stderr_reader.start()
+    modules = parse_olevba_lines(line.rstrip(b"\r\n") for line in process.stdout)
+    stderr_reader.join()
+    stderr = _decode_olevba(b"".join(stderr_chunks))
+    process.wait()
+
+    if process.returncode != 0:
+        raise RuntimeError(f"olevba failed: {stderr}")
+
+    if not modules:
+        raise RuntimeError("No VBA modules found in Excel file")
 
-def parse_olevba_output(output: str) -> Dict[str, Dict[str, str]]:
-    """Parse olevba output to extract module names and content."""
+    return modules
+
+
+def _decode_olevba(data: bytes) -> str:
+    """Decode a fragment of olevba output."""
+    return data.decode("utf-8", errors="replace")
+
+
+def parse_olevba_lines(lines: Iterable[bytes]) -> Dict[str, Dict[str, str]]:
+    """Parse olevba output line by line as it is produced.
+
+    Lines are matched as raw bytes; only module names and module bodies are
+    decoded. Returns an empty dictionary if no modules were found.
+    """
     modules = {}
     current_module = None
     current_content = []
     in_vba_code = False
 
-    for line in output.split("\n"):
-        if line.startswith(
-            "-------------------------------------------------------------------------------"
-        ):
+    for line in lines:
+        if line.startswith(_DIVIDER):
             if current_module:
-                content = normalize_vba_content("\n".join(current_content))
+                content = normalize_vba_lines(map(_decode_olevba, current_content))
                 modules[current_module] = {"content": content, "is_events": False}
                 current_content = []
             in_vba_code = False
             current_module = None
-        elif line.startswith("VBA MACRO "):
-            parts = line.split()
-            if len(parts) >= 3:
-                module_name_with_ext = parts[2]
-                current_module = module_name_with_ext.rsplit(".", 1)[0]
+        elif line.startswith(_VBA_MACRO):
+            module_name_with_ext = line[len(_VBA_MACRO) :].lstrip().partition(b" ")[0]
+            if module_name_with_ext:
+                current_module = _decode_olevba(module_name_with_ext.rsplit(b".", 1)[0])
             in_vba_code = True
-        elif (
-            in_vba_code
-            and line
-            and not line.startswith("- - - - -")
-            and not line.startswith("in file:")
-        ):
+        elif in_vba_code and line and not line.startswith(_IGNORE_IN_VBA):
             current_content.append(line)
 
     if current_module:
-        content = normalize_vba_content("\n".join(current_content))
+        content = normalize_vba_lines(map(_decode_olevba, current_content))
         modules[current_module] = {"content": content, "is_events": False}
 
-    if not modules:
-        raise RuntimeError("No VBA modules found in Excel file")
-
     return modules
 
 
@@ -154,15 +223,20 @@ def read_bas_files(vba_dir: Path) -> Dict[str, str]:
     """Read all .bas files from a directory."""
     modules = {}
 
-    for bas_file in vba_dir.glob("*.bas"):
-        content = bas_file.read_text(encoding="utf-8")
-        module_name = extract_module_name(content, bas_file.stem)
-        normalized = normalize_vba_content(content)
+    with os.scandir(vba_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".bas") or not entry.is_file():
+                continue
+            with open(entry.path, encoding="utf-8") as f:
+                content = f.read()
+            lines = content.split("\n")
+            module_name = extract_module_name(lines, entry.name[: -len(".bas")])
+            normalized = normalize_vba_lines(lines)
 
-        modules[module_name] = {
-            "content": normalized,
-            "is_events": module_name == "TabulaServerEvents",
-        }
+            modules[module_name] = {
+                "content": normalized,
+                "is_events": module_name == "TabulaServerEvents",
+            }
 
     if not modules:
         raise RuntimeError(f"No .bas files found in {vba_dir}")
@@ -170,9 +244,9 @@ def read_bas_files(vba_dir: Path) -> Dict[str, str]:
     return modules
 
 
-def extract_module_name(content: str, fallback: str) -> str:
+def extract_module_name(lines: List[str], fallback: str) -> str:
     """Extract the VB module name from Attribute VB_Name line."""
-    for line in content.split("\n"):
+    for line in lines:
         if line.startswith("Attribute VB_Name = "):
             name = line.split("=", 1)[1].strip()
             return name.strip('"')
@@ -181,16 +255,20 @@ def extract_module_name(content: str, fallback: str) -> str:
 
 def snake_to_camel(snake_str: str) -> str:
     """Convert snake_case to CamelCase."""
+    if snake_str.replace("_", "").isalpha():
+        # str.title() also capitalizes after digits and apostrophes, so it
+        # only matches capitalize() per component for purely alphabetic names.
+        return snake_str.replace("_", " ").title().replace(" ", "")
     components = snake_str.split("_")
     return "".join(word.capitalize() for word in components)
 
 
-def normalize_vba_content(content: str) -> str:
-    """Normalize VBA content by removing metadata, blank lines, and trailing whitespace."""
+def normalize_vba_lines(content_lines: Iterable[str]) -> str:
+    """Normalize VBA lines by removing metadata, blank lines, and trailing whitespace."""
     lines = []
     in_analysis_table = False
 
-    for line in content.split("\n"):
+    for line in content_lines:
         stripped = line.rstrip()
 
         if "+----------+--------------------+" in stripped:
@@ -198,23 +276,15 @@ def normalize_vba_content(content: str) -> str:
             continue
 
         if in_analysis_table:
-            if (
-                stripped
-                and not stripped.startswith("|")
-                and not stripped.startswith("+")
-            ):
+            if stripped and not stripped.startswith(_ANALYSIS_TABLE_ROW):
                 in_analysis_table = False
             else:
                 continue
 
-        if (
-            stripped
-            and not stripped.startswith("Attribute VB_")
-            and not stripped.startswith("VBA Stomping detection is experimental")
-        ):
-            lines.append(stripped.lower())
+        if stripped and not stripped.startswith(_SKIP_ATTR):
+            lines.append(stripped)
 
-    return "\n".join(lines).strip()
+    return "\n".join(lines).strip().lower()
 
 
 def compare_modules(
@@ -268,16 +338,17 @@ def verify_events_in_thisworkbook(
         return True
 
     thisworkbook_content = extracted["ThisWorkbook"]["content"]
+    if events_content.strip() and events_content in thisworkbook_content:
+        return True
+
+    thisworkbook_lines = set(thisworkbook_content.split("\n"))
     events_lines = [
         line
         for line in events_content.split("\n")
         if line.strip() and not line.strip().startswith("option explicit")
     ]
 
-    missing_lines = []
-    for line in events_lines:
-        if line.strip() and line not in thisworkbook_content:
-            missing_lines.append(line)
+    missing_lines = [line for line in events_lines if line not in thisworkbook_lines]
 
     if missing_lines:
         print(
@@ -291,18 +362,31 @@ def verify_events_in_thisworkbook(
 
 
 def print_diff(source: str, extracted: str):
-    """Print line-by-line differences between source and extracted content."""
+    """Print line-by-line differences between source and extracted content.
+
+    Lines are aligned with SequenceMatcher so that a single inserted or removed
+    line does not report every following line as different. Uses cdifflib's C
+    implementation when it is installed.
+    """
     source_lines = source.split("\n")
     extracted_lines = extracted.split("\n")
 
-    max_len = max(len(source_lines), len(extracted_lines))
-
-    for i in range(max_len):
-        source_line = source_lines[i] if i < len(source_lines) else ""
-        extracted_line = extracted_lines[i] if i < len(extracted_lines) else ""
+    matcher = SequenceMatcher(None, source_lines, extracted_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
 
-        if source_line != extracted_line:
-            print(f"  Line {i + 1}:", file=sys.stderr)
+        for offset in range(max(i2 - i1, j2 - j1)):
+            has_source = i1 + offset < i2
+            has_extracted = j1 + offset < j2
+            source_line = source_lines[i1 + offset] if has_source else ""
+            extracted_line = extracted_lines[j1 + offset] if has_extracted else ""
+            source_number = str(i1 + offset + 1) if has_source else "-"
+            extracted_number = str(j1 + offset + 1) if has_extracted else "-"
+            print(
+                f"  Line {source_number} (extracted line {extracted_number}):",
+                file=sys.stderr,
+            )
             print(f"    Source:    {source_line}", file=sys.stderr)
             print(f"    Extracted: {extracted_line}", file=sys.stderr)
 
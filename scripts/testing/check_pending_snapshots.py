@@ -7,25 +7,30 @@ These files indicate that snapshot tests have produced new output that needs
 to be reviewed with 'cargo insta review' before committing.
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import List
 
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
 
-def find_project_root(start_path: Path) -> Optional[Path]:
-    """Find the project root by looking for a justfile."""
-    current = start_path.resolve()
-    while current != current.parent:
-        if (current / "justfile").exists():
-            return current
-        current = current.parent
-    return None
+from _common import find_project_root
+
+# Build output and VCS directories that never contain insta snapshots. "bin" is
+# deliberately absent: Rust crates keep binary targets under src/bin.
+SKIP_DIRS = {".git", "target", "node_modules", "Library", "Temp", "Build", "obj"}
 
 
 def find_pending_snapshots(root: Path) -> List[Path]:
     """Find all .pending-snap files in the repository."""
-    # Search in the entire repository
-    pending_snapshots = list(root.rglob("*.pending-snap"))
+    pending_snapshots = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(".pending-snap"):
+                pending_snapshots.append(Path(dirpath) / filename)
     return pending_snapshots
 
 
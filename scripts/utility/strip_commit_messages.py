@@ -4,112 +4,110 @@ Script to strip 'Generated with' and 'Co-Authored-By' lines from git commit mess
 Only processes unpushed commits to avoid rewriting history that's already been shared.
 """
 
+import os
 import subprocess
 import sys
 import re
 import argparse
+from functools import lru_cache
+
+# Body of the git filter-repo --commit-callback. It runs inside filter-repo, where
+# commit.message is bytes. Messages without a line to strip are left untouched so
+# that commits without markers keep their hashes.
+FILTER_REPO_CALLBACK = """
+if b"Generated with" in commit.message or b"Co-Authored-By:" in commit.message:
+    lines = commit.message.split(b"\\n")
+    kept = [
+        line
+        for line in lines
+        if b"Generated with" not in line
+        and not line.strip().startswith(b"Co-Authored-By:")
+    ]
+    if len(kept) < len(lines):
+        while kept and not kept[-1].strip():
+            kept.pop()
+        commit.message = b"\\n".join(kept) + b"\\n"
+"""
 
 
-def run_command(cmd, check=True, capture_output=True):
-    """Run a shell command and return the result."""
+def run_command(args, check=True, capture_output=True, env=None):
+    """Run a command given as an argument list and return the result."""
     result = subprocess.run(
-        cmd, shell=True, capture_output=capture_output, text=True, check=False
+        args, capture_output=capture_output, text=True, check=False, env=env
     )
     if check and result.returncode != 0:
-        print(f"Command failed: {cmd}", file=sys.stderr)
+        print(f"Command failed: {' '.join(args)}", file=sys.stderr)
         print(f"Error: {result.stderr}", file=sys.stderr)
         sys.exit(1)
     return result
 
 
+@lru_cache(maxsize=1)
 def get_upstream_branch():
     """Get the upstream branch for the current branch."""
     result = run_command(
-        "git rev-parse --abbrev-ref --symbolic-full-name @{u}", check=False
+        ["git", "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}"],
+        check=False,
     )
     if result.returncode == 0:
         return result.stdout.strip()
 
     # Fallback to origin/master if no upstream is set
-    result = run_command("git rev-parse --verify origin/master", check=False)
+    result = run_command(["git", "rev-parse", "--verify", "origin/master"], check=False)
     if result.returncode == 0:
         return "origin/master"
 
     # Try origin/main as another fallback
-    result = run_command("git rev-parse --verify origin/main", check=False)
+    result = run_command(["git", "rev-parse", "--verify", "origin/main"], check=False)
     if result.returncode == 0:
         return "origin/main"
 
     return None
 
 
-def get_unpushed_commits():
-    """Get list of commit hashes that haven't been pushed."""
-    upstream = get_upstream_branch()
-    if not upstream:
-        # No remote tracking, check all commits
-        result = run_command("git rev-list HEAD", check=False)
-        if result.returncode != 0:
-            return []
-        commits = result.stdout.strip().split("\n")
-        return [c for c in commits if c]
-
-    result = run_command(f"git rev-list {upstream}..HEAD", check=False)
+def get_unpushed_commit_details(upstream):
+    """Get (hash, short hash, subject, message) for each commit not in upstream.
+
+    Checks all commits when upstream is None. Uses a single git log invocation
+    with NUL-separated fields and ASCII record separators between commits.
+    """
+    revision_range = f"{upstream}..HEAD" if upstream else "HEAD"
+    result = run_command(
+        ["git", "log", "--format=%H%x00%h%x00%s%x00%B%x1e", revision_range],
+        check=False,
+    )
     if result.returncode != 0:
         return []
 
-    commits = result.stdout.strip().split("\n")
-    return [c for c in commits if c]
-
-
-def get_commit_message(commit_hash):
-    """Get the full commit message for a given commit."""
-    result = run_command(f"git log -1 --format=%B {commit_hash}")
-    return result.stdout
+    details = []
+    for record in result.stdout.split("\x1e"):
+        record = record.lstrip("\n")
+        if not record:
+            continue
+        commit_hash, short_hash, subject, message = record.split("\x00", 3)
+        details.append((commit_hash, short_hash, subject, message))
+    return details
 
 
 def should_strip_message(message):
     """Check if a commit message contains lines that should be stripped."""
-    lines = message.split("\n")
-    for line in lines:
-        stripped = line.strip()
-        if "Generated with" in stripped or stripped.startswith("Co-Authored-By:"):
-            return True
-    return False
-
-
-def strip_message(message):
-    """Remove lines containing 'Generated with' or 'Co-Authored-By' from message."""
-    lines = message.split("\n")
-    filtered_lines = []
-
-    for line in lines:
-        stripped = line.strip()
-        # Skip lines containing 'Generated with' or starting with 'Co-Authored-By:'
-        if "Generated with" in line or stripped.startswith("Co-Authored-By:"):
-            continue
-        filtered_lines.append(line)
-
-    # Remove trailing empty lines
-    while filtered_lines and not filtered_lines[-1].strip():
-        filtered_lines.pop()
-
-    return "\n".join(filtered_lines)
+    if "Generated with" in message:
+        return True
+    # Most messages contain neither marker, so avoid splitting them at all
+    if "Co-Authored-By:" not in message:
+        return False
+    return any(
+        line.lstrip().startswith("Co-Authored-By:") for line in message.split("\n")
+    )
 
 
 def check_commits(verbose=False):
     """Check if any unpushed commits contain the unwanted lines."""
-    commits = get_unpushed_commits()
-    if not commits:
-        return True
-
     found_issues = False
-    for commit in commits:
-        message = get_commit_message(commit)
+    upstream = get_upstream_branch()
+    for _, short_hash, subject, message in get_unpushed_commit_details(upstream):
         if should_strip_message(message):
             found_issues = True
-            short_hash = run_command(f"git log -1 --format=%h {commit}").stdout.strip()
-            subject = run_command(f"git log -1 --format=%s {commit}").stdout.strip()
             print(
                 f"Commit {short_hash} contains 'Generated with' or 'Co-Authored-By' lines: {subject}"
             )
@@ -119,26 +117,80 @@ def check_commits(verbose=False):
 
 def strip_commits():
     """Strip the unwanted lines from all unpushed commits."""
-    commits = get_unpushed_commits()
-    if not commits:
+    upstream = get_upstream_branch()
+    if not any(
+        should_strip_message(message)
+        for _, _, _, message in get_unpushed_commit_details(upstream)
+    ):
         return
 
-    # Check if any commits need stripping
-    commits_to_strip = []
-    for commit in commits:
-        message = get_commit_message(commit)
-        if should_strip_message(message):
-            commits_to_strip.append(commit)
-
-    if not commits_to_strip:
+    if upstream and strip_with_filter_repo(upstream):
         return
 
-    # Get the upstream branch to rebase from
-    upstream = get_upstream_branch()
+    strip_with_rebase(upstream)
+
+
+def get_current_branch():
+    """Return the short name of the checked-out branch, or None if detached."""
+    result = run_command(
+        ["git", "symbolic-ref", "--quiet", "--short", "HEAD"], check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def filter_repo_available():
+    """Check whether the git filter-repo extension is installed."""
+    result = run_command(["git", "filter-repo", "--version"], check=False)
+    return result.returncode == 0
+
+
+def strip_with_filter_repo(upstream):
+    """Rewrite unpushed commit messages in one git filter-repo run.
+
+    filter-repo updates refs by name, so the range is given as upstream..branch.
+    Returns False without changing anything if filter-repo is not installed,
+    HEAD is detached, or the working tree has uncommitted changes, so the
+    caller can fall back to the rebase path.
+    """
+    if not filter_repo_available():
+        return False
+
+    branch = get_current_branch()
+    if not branch:
+        return False
+
+    status = run_command(["git", "status", "--porcelain", "--untracked-files=no"])
+    if status.stdout.strip():
+        return False
+
+    result = run_command(
+        [
+            "git",
+            "filter-repo",
+            "--force",
+            "--quiet",
+            "--commit-callback",
+            FILTER_REPO_CALLBACK,
+            "--refs",
+            f"{upstream}..{branch}",
+        ],
+        check=False,
+        capture_output=False,
+    )
+    if result.returncode != 0:
+        print("\ngit filter-repo failed.", file=sys.stderr)
+        sys.exit(1)
+    return True
+
+
+def strip_with_rebase(upstream):
+    """Strip the unwanted lines by amending each commit during a rebase."""
     if not upstream:
         print("Warning: No upstream branch found, using all commits on current branch")
         # Get the first commit
-        result = run_command("git rev-list --max-parents=0 HEAD")
+        result = run_command(["git", "rev-list", "--max-parents=0", "HEAD"])
         base = result.stdout.strip()
     else:
         base = upstream
@@ -160,13 +212,21 @@ fi
     with open("/tmp/git-strip-commit-msg.sh", "w") as f:
         f.write(script_content)
 
-    run_command("chmod +x /tmp/git-strip-commit-msg.sh", capture_output=False)
+    os.chmod("/tmp/git-strip-commit-msg.sh", 0o755)
 
     # Run git rebase with the script
     result = run_command(
-        f"GIT_SEQUENCE_EDITOR=true git rebase -i --exec /tmp/git-strip-commit-msg.sh {base}",
+        [
+            "git",
+            "rebase",
+            "-i",
+            "--exec",
+            "/tmp/git-strip-commit-msg.sh",
+            base,
+        ],
         check=False,
         capture_output=False,
+        env={**os.environ, "GIT_SEQUENCE_EDITOR": "true"},
     )
 
     if result.returncode != 0:
@@ -6,11 +6,34 @@ Copies directory contents to a destination and creates symlinks pointing to the
 
 import os
 import sys
+import errno
 import shutil
 import argparse
 from pathlib import Path
 
 
+def move_directory(source, dest):
+    """Move a directory, renaming in place when both paths share a filesystem.
+
+    An existing destination is replaced. Across devices the old destination is
+    removed, then the source is copied into its place and removed.
+    """
+    try:
+        os.rename(source, dest)
+        return
+    except OSError as e:
+        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+            shutil.rmtree(dest)
+            os.rename(source, dest)
+            return
+        if e.errno != errno.EXDEV:
+            raise
+    if os.path.exists(dest):
+        shutil.rmtree(dest)
+    shutil.copytree(source, dest)
+    shutil.rmtree(source)
+
+
 def replace_with_symlink(source_dir, dest_base):
     """Replace a directory with a symlink pointing to its new location."""
     source_path = Path(source_dir)
@@ -54,27 +77,20 @@ def replace_with_symlink(source_dir, dest_base):
     # Create destination directory structure if it doesn't exist
     dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Only copy if source exists (it might have been an incorrect symlink we removed)
+    # Only move if source exists (it might have been an incorrect symlink we removed)
+    moved = False
     if source_path.exists():
-        # Copy the directory contents to destination
-        print(f"Copying '{source_dir}' to '{dest_path}'...")
+        # Move the directory to the destination
+        print(f"Moving '{source_dir}' to '{dest_path}'...")
         try:
             if dest_path.exists():
                 print(
-                    f"Warning: Destination '{dest_path}' already exists, removing it first"
+                    f"Warning: Destination '{dest_path}' already exists, replacing it"
                 )
-                shutil.rmtree(dest_path)
-            shutil.copytree(source_path_resolved, dest_path)
-        except Exception as e:
-            print(f"Error copying directory: {e}")
-            return False
-
-        # Remove the original directory
-        print(f"Removing original directory '{source_dir}'...")
-        try:
-            shutil.rmtree(source_path_resolved)
+            move_directory(source_path_resolved, dest_path)
+            moved = True
         except Exception as e:
-            print(f"Error removing original directory: {e}")
+            print(f"Error moving directory: {e}")
             return False
     elif not dest_path.exists():
         print(
@@ -96,12 +112,11 @@ def replace_with_symlink(source_dir, dest_base):
         return True
     except Exception as e:
         print(f"Error creating symlink: {e}")
-        # Try to restore the original directory if we had copied it
-        if source_path_resolved.exists():
+        # Try to restore the original directory if we had moved it
+        if moved:
             print("Attempting to restore original directory...")
             try:
-                shutil.copytree(dest_path, source_path)
-                shutil.rmtree(dest_path)
+                move_directory(dest_path, source_path_resolved)
                 print("Original directory restored")
             except Exception as restore_error:
                 print(f"Failed to restore original directory: {restore_error}")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""Unit tests for strip_commit_messages.py."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+UTILITY_DIR = SCRIPT_DIR.parent
+if str(UTILITY_DIR) not in sys.path:
+    sys.path.insert(0, str(UTILITY_DIR))
+
+import strip_commit_messages
+
+
+def run_callback(message: bytes) -> bytes:
+    """Run the filter-repo commit callback on a fake commit."""
+    commit = SimpleNamespace(message=message)
+    exec(strip_commit_messages.FILTER_REPO_CALLBACK, {"commit": commit})
+    return commit.message
+
+
+class FilterRepoCallbackTests(unittest.TestCase):
+    def test_strips_marker_lines_and_trailing_blanks(self) -> None:
+        message = (
+            b"Fix parser\n\nDetails\n\nGenerated with a tool\n"
+            b"Co-Authored-By: Someone <a@b>\n"
+        )
+        self.assertEqual(run_callback(message), b"Fix parser\n\nDetails\n")
+
+    def test_leaves_message_without_markers_untouched(self) -> None:
+        message = b"Fix parser\n\nDetails\n\n\n"
+        self.assertEqual(run_callback(message), message)
+
+    def test_leaves_message_with_inline_coauthor_mention_untouched(self) -> None:
+        message = b"Document the Co-Authored-By: trailer\n\n"
+        self.assertEqual(run_callback(message), message)
+
+
+class StripWithFilterRepoTests(unittest.TestCase):
+    def fake_git(self, branch: str | None) -> MagicMock:
+        def run(args: list[str], **_kwargs: object) -> SimpleNamespace:
+            if args[:2] == ["git", "symbolic-ref"]:
+                if branch is None:
+                    return SimpleNamespace(returncode=1, stdout="")
+                return SimpleNamespace(returncode=0, stdout=f"{branch}\n")
+            return SimpleNamespace(returncode=0, stdout="")
+
+        return MagicMock(side_effect=run)
+
+    def filter_repo_calls(self, run_command: MagicMock) -> list[list[str]]:
+        return [
+            call.args[0]
+            for call in run_command.call_args_list
+            if call.args[0][:2] == ["git", "filter-repo"]
+            and "--version" not in call.args[0]
+        ]
+
+    def test_rewrites_range_ending_at_current_branch(self) -> None:
+        run_command = self.fake_git("feature")
+        with patch.object(strip_commit_messages, "run_command", run_command):
+            self.assertTrue(strip_commit_messages.strip_with_filter_repo("origin/main"))
+        calls = self.filter_repo_calls(run_command)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][-2:], ["--refs", "origin/main..feature"])
+
+    def test_detached_head_falls_back(self) -> None:
+        run_command = self.fake_git(None)
+        with patch.object(strip_commit_messages, "run_command", run_command):
+            self.assertFalse(
+                strip_commit_messages.strip_with_filter_repo("origin/main")
+            )
+        self.assertEqual(self.filter_repo_calls(run_command), [])
+
+
+class GetCurrentBranchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.original_cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+        self.git("init", "-q", "-b", "feature")
+        self.git("commit", "-q", "--allow-empty", "-m", "base")
+
+    def tearDown(self) -> None:
+        os.chdir(self.original_cwd)
+        self.tmpdir.cleanup()
+
+    def git(self, *args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+            + list(args),
+            check=True,
+            capture_output=True,
+        )
+
+    def test_returns_branch_name(self) -> None:
+        self.assertEqual(strip_commit_messages.get_current_branch(), "feature")
+
+    def test_detached_head_returns_none(self) -> None:
+        self.git("checkout", "-q", "--detach")
+        self.assertIsNone(strip_commit_messages.get_current_branch())
+
+
+if __name__ == "__main__":
+    unittest.main()